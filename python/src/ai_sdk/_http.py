@@ -34,6 +34,9 @@ logger = get_logger(__name__)
 # Status codes that should trigger retry
 RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
 
+# User-Agent sent when the caller does not configure one
+_DEFAULT_USER_AGENT = "ai-sdk-python/0.0.2"
+
 
 def _generate_request_id() -> str:
     """Generate a unique request ID for correlation."""
@@ -132,7 +135,6 @@ class HTTPClient:
         max_retries: int = 3,
         retry_delay: float = 1.0,
         user_agent: str | None = None,
-        extra_headers: dict[str, str] | None = None,
     ):
         """
         Initialize the HTTP client.
@@ -145,7 +147,6 @@ class HTTPClient:
             max_retries: Maximum number of retry attempts
             retry_delay: Base delay between retries (exponential backoff)
             user_agent: Custom User-Agent string
-            extra_headers: Additional headers merged into every request (overrides defaults)
         """
         self._base_url = base_url.rstrip("/")
         self._auth = auth
@@ -153,8 +154,7 @@ class HTTPClient:
         self._verify_ssl = verify_ssl
         self._max_retries = max_retries
         self._retry_delay = retry_delay
-        self._user_agent = user_agent or "ai-sdk-python/0.0.2"
-        self._extra_headers = extra_headers or {}
+        self._user_agent = user_agent or _DEFAULT_USER_AGENT
 
         self._client = httpx.Client(
             base_url=self._base_url,
@@ -164,31 +164,6 @@ class HTTPClient:
 
         logger.debug("HTTPClient initialized for %s", self._base_url)
 
-    @property
-    def timeout(self) -> float:
-        """Request timeout in seconds."""
-        return self._timeout
-
-    @property
-    def verify_ssl(self) -> bool:
-        """Whether SSL certificates are verified."""
-        return self._verify_ssl
-
-    @property
-    def max_retries(self) -> int:
-        """Maximum retry attempts."""
-        return self._max_retries
-
-    @property
-    def retry_delay(self) -> float:
-        """Base delay between retries."""
-        return self._retry_delay
-
-    @property
-    def user_agent(self) -> str:
-        """User-Agent string."""
-        return self._user_agent
-
     def _headers(self, request_id: str | None = None) -> dict[str, str]:
         """Get request headers."""
         headers = self._auth.get_headers()
@@ -197,7 +172,6 @@ class HTTPClient:
         headers["User-Agent"] = self._user_agent
         if request_id:
             headers["X-Request-ID"] = request_id
-        headers.update(self._extra_headers)
         return headers
 
     def _should_retry(self, response: httpx.Response, attempt: int) -> bool:
@@ -273,27 +247,35 @@ class HTTPClient:
         path: str,
         json: dict[str, Any],
         agent_name: str | None = None,
+        headers: dict[str, str] | None = None,
     ) -> dict[str, Any]:
         """
         Make a POST request with retry support.
 
         Args:
-            path: Request path
+            path: Request path, or an absolute URL to bypass the base URL
             json: Request body
             agent_name: Agent name for error context
+            headers: Additional headers for this request (overrides defaults)
 
         Returns:
             Response JSON data
         """
         request_id = _generate_request_id()
-        logger.debug("[req:%s] POST %s%s", request_id, self._base_url, path)
+        # Absolute URLs bypass the base URL, so log them as given.
+        base_url = "" if "://" in path else self._base_url
+        logger.debug("[req:%s] POST %s%s", request_id, base_url, path)
         logger.debug("[req:%s] Request body: %s", request_id, json_module.dumps(json, indent=2))
 
+        request_headers = self._headers(request_id)
+        if headers:
+            request_headers.update(headers)
+
         last_response = None
         for attempt in range(self._max_retries + 1):
             response = self._client.post(
                 path,
-                headers=self._headers(request_id),
+                headers=request_headers,
                 json=json,
             )
             last_response = response
@@ -406,7 +388,7 @@ class AsyncHTTPClient:
         self._verify_ssl = verify_ssl
         self._max_retries = max_retries
         self._retry_delay = retry_delay
-        self._user_agent = user_agent or "ai-sdk-python/0.0.2"
+        self._user_agent = user_agent or _DEFAULT_USER_AGENT
         self._client: httpx.AsyncClient | None = None
 
         logger.debug("AsyncHTTPClient initialized for %s", self._base_url)
@@ -7,6 +7,30 @@ from collections.abc import AsyncIterator, Iterator
 
 from ai_sdk.models import EventType, StreamEvent
 
+# SSE events are separated by a blank line
+_EVENT_DELIMITER = b"\n\n"
+
+
+def _pop_event(buffer: bytearray) -> bytes | None:
+    """
+    Remove the next complete event from the front of the buffer.
+
+    Events are located on the raw bytes and decoded only once complete,
+    so multi-byte UTF-8 characters split across chunks are handled.
+
+    Args:
+        buffer: Accumulated response bytes (mutated in place)
+
+    Returns:
+        Raw event bytes, or None if no complete event is buffered
+    """
+    idx = buffer.find(_EVENT_DELIMITER)
+    if idx == -1:
+        return None
+    event = bytes(buffer[:idx])
+    del buffer[: idx + len(_EVENT_DELIMITER)]
+    return event
+
 
 def _parse_event(event_str: str) -> StreamEvent | None:
     """
@@ -19,18 +43,20 @@ def _parse_event(event_str: str) -> StreamEvent | None:
         Parsed StreamEvent or None if invalid
     """
     event_type: str | None = None
-    data: str | None = None
+    data_lines: list[str] = []
 
     for line in event_str.split("\n"):
         line = line.strip()
         if line.startswith("event:"):
             event_type = line[6:].strip()
         elif line.startswith("data:"):
-            data = line[5:].strip()
+            data_lines.append(line[5:].strip())
         elif line.startswith("id:"):
             # Event ID, currently not used
             pass
 
+    # Per the SSE spec, multiple data lines form one payload joined by newlines
+    data = "\n".join(data_lines)
     if not data:
         return None
 
@@ -132,23 +158,22 @@ class SSEIterator:
             byte_stream: Iterator of response bytes
         """
         self._stream = byte_stream
-        self._buffer = ""
+        self._buffer = bytearray()
 
     def __iter__(self) -> Iterator[StreamEvent]:
         """Iterate over stream events."""
         for chunk in self._stream:
-            self._buffer += chunk.decode("utf-8")
+            self._buffer += chunk
 
             # Process complete events (delimited by double newlines)
-            while "\n\n" in self._buffer:
-                event_str, self._buffer = self._buffer.split("\n\n", 1)
-                event = _parse_event(event_str)
+            while (raw := _pop_event(self._buffer)) is not None:
+                event = _parse_event(raw.decode("utf-8"))
                 if event:
                     yield event
 
         # Process any remaining buffer content
         if self._buffer.strip():
-            event = _parse_event(self._buffer)
+            event = _parse_event(self._buffer.decode("utf-8"))
             if event:
                 yield event
 
@@ -164,7 +189,7 @@ class AsyncSSEIterator:
             byte_stream: Async iterator of response bytes
         """
         self._stream = byte_stream
-        self._buffer = ""
+        self._buffer = bytearray()
 
     def __aiter__(self) -> AsyncSSEIterator:
         return self
@@ -173,21 +198,20 @@ class AsyncSSEIterator:
         """Get the next stream event."""
         while True:
             # Check if we have a complete event in buffer
-            while "\n\n" in self._buffer:
-                event_str, self._buffer = self._buffer.split("\n\n", 1)
-                event = _parse_event(event_str)
+            while (raw := _pop_event(self._buffer)) is not None:
+                event = _parse_event(raw.decode("utf-8"))
                 if event:
                     return event
 
             # Need more data from stream
             try:
                 chunk = await self._stream.__anext__()
-                self._buffer += chunk.decode("utf-8")
+                self._buffer += chunk
             except StopAsyncIteration:
                 # Process any remaining buffer content
                 if self._buffer.strip():
-                    event = _parse_event(self._buffer)
-                    self._buffer = ""
+                    event = _parse_event(self._buffer.decode("utf-8"))
+                    self._buffer.clear()
                     if event:
                         return event
                 raise StopAsyncIteration
@@ -2,18 +2,32 @@
 
 from __future__ import annotations
 
+import itertools
 import json
-import uuid
 from typing import TYPE_CHECKING
 
 import httpx
 
 if TYPE_CHECKING:
+    from ai_sdk._http import HTTPClient
     from ai_sdk.auth import TokenAuth
 
-from ai_sdk._http import HTTPClient
 from ai_sdk.exceptions import AISdkError, MCPError, MCPToolExecutionError
-from ai_sdk.mcp.models import MCPTool, ToolCallResult, ToolInfo, ToolParameter
+from ai_sdk.mcp._openai import build_openai_tools, create_tool_executor
+from ai_sdk.mcp.models import (
+    _MCP_TOOL_BY_VALUE,
+    MCPTool,
+    ToolCallResult,
+    ToolInfo,
+    ToolParameter,
+)
+
+# Base JSON-RPC 2.0 envelope, copied and filled in for every request.
+_JSONRPC_TEMPLATE: dict = {"jsonrpc": "2.0", "id": None, "method": None, "params": None}
+# Shared default for requests without params. Never mutated.
+_EMPTY_PARAMS: dict = {}
+# The MCP streamable HTTP transport requires clients to accept both JSON and SSE
+_MCP_HEADERS = {"Accept": "application/json, text/event-stream"}
 
 
 def _filter_tools(
@@ -32,22 +46,25 @@ def _filter_tools(
     Returns:
         Filtered list of ToolInfo
     """
-    if include is not None:
-        include_set = set(include)
-        tools = [t for t in tools if t.name in include_set]
+    if include is None and exclude is None:
+        return tools
 
-    if exclude is not None:
-        exclude_set = set(exclude)
-        tools = [t for t in tools if t.name not in exclude_set]
-
-    return tools
+    # One pass over the tools, with O(1) membership checks on both lists.
+    include_set = None if include is None else frozenset(include)
+    exclude_set = frozenset(exclude or ())
+    return [
+        t
+        for t in tools
+        if (include_set is None or t.name in include_set) and t.name not in exclude_set
+    ]
 
 
 class MCPClient:
     """Client for OpenMetadata's MCP server.
 
-    Uses a dedicated HTTPClient to inherit the SDK's retry logic,
-    SSL verification, timeout, and user agent settings.
+    Shares the SDK's HTTPClient, so MCP requests reuse its connection pool
+    along with its retry logic, SSL verification, timeout, and user agent
+    settings.
     """
 
     def __init__(
@@ -58,35 +75,24 @@ class MCPClient:
     ) -> None:
         self._host = host.rstrip("/")
         self._auth = auth
-
-        # Create a dedicated HTTP client for MCP requests that inherits
-        # timeout, SSL, retry, and user-agent settings from the parent.
-        # base_url is the host root (not /mcp) so we can POST to "/mcp"
-        # directly — avoids httpx appending a trailing slash which the
-        # Java MCP transport rejects with 405.
-        self._http = HTTPClient(
-            base_url=self._host,
-            auth=auth,
-            timeout=http.timeout,
-            verify_ssl=http.verify_ssl,
-            max_retries=http.max_retries,
-            retry_delay=http.retry_delay,
-            user_agent=http.user_agent,
-            extra_headers={"Accept": "application/json, text/event-stream"},
-        )
+        self._http = http
+        # Absolute URL so the request bypasses the parent client's base_url.
+        # Posting to "{host}/mcp" directly also avoids httpx appending a
+        # trailing slash, which the Java MCP transport rejects with 405.
+        self._url = f"{self._host}/mcp"
+        # JSON-RPC ids only need to be unique per client; a counter avoids
+        # generating a UUID on every call.
+        self._next_id = itertools.count(1).__next__
 
     def _make_jsonrpc_request(self, method: str, params: dict | None = None) -> dict:
         """Make a JSON-RPC 2.0 request to the MCP server."""
-        request_id = str(uuid.uuid4())[:8]
-        payload = {
-            "jsonrpc": "2.0",
-            "id": request_id,
-            "method": method,
-            "params": params or {},
-        }
+        payload = _JSONRPC_TEMPLATE.copy()
+        payload["id"] = self._next_id()
+        payload["method"] = method
+        payload["params"] = params or _EMPTY_PARAMS
 
         try:
-            result = self._http.post("/mcp", json=payload)
+            result = self._http.post(self._url, json=payload, headers=_MCP_HEADERS)
         except (AISdkError, httpx.HTTPError) as exc:
             raise MCPError(f"MCP request failed: {exc}") from exc
 
@@ -98,15 +104,23 @@ class MCPClient:
     def list_tools(self) -> list[ToolInfo]:
         """Fetch available tools from MCP server."""
         result = self._make_jsonrpc_request("tools/list")
-        tools_data = result.get("tools", [])
-        parsed = [self._parse_tool_info(t) for t in tools_data]
-        return [t for t in parsed if t is not None]
+        return [
+            info
+            for data in result.get("tools", [])
+            if (info := self._parse_tool_info(data)) is not None
+        ]
 
-    def call_tool(self, name: MCPTool, arguments: dict) -> ToolCallResult:
-        """Execute a tool via MCP protocol."""
+    def call_tool(self, name: MCPTool | str, arguments: dict) -> ToolCallResult:
+        """Execute a tool via MCP protocol.
+
+        Args:
+            name: Tool to call, as an MCPTool or its string value
+            arguments: Tool arguments
+        """
+        name_str = name.value if isinstance(name, MCPTool) else name
         result = self._make_jsonrpc_request(
             "tools/call",
-            {"name": name.value, "arguments": arguments},
+            {"name": name_str, "arguments": arguments},
         )
 
         is_error = result.get("isError", False)
@@ -120,7 +134,7 @@ class MCPClient:
 
         if is_error:
             raise MCPToolExecutionError(
-                tool=name.value,
+                tool=name_str,
                 message=text or "Tool execution failed",
             )
 
@@ -139,9 +153,8 @@ class MCPClient:
         Returns None for tools not recognized by the SDK, allowing
         graceful handling of new server-side tools.
         """
-        try:
-            name = MCPTool(data["name"])
-        except ValueError:
+        name = _MCP_TOOL_BY_VALUE.get(data.get("name"))
+        if name is None:
             return None
         description = data.get("description", "")
         parameters = self._parse_parameters(data.get("inputSchema", {}))
@@ -152,21 +165,16 @@ class MCPClient:
         if schema.get("type") != "object":
             return []
 
-        properties = schema.get("properties", {})
-        required = set(schema.get("required", []))
-        parameters = []
-
-        for name, prop in properties.items():
-            parameters.append(
-                ToolParameter(
-                    name=name,
-                    type=prop.get("type", "string"),
-                    description=prop.get("description", ""),
-                    required=name in required,
-                )
+        required = frozenset(schema.get("required", ()))
+        return [
+            ToolParameter(
+                name=name,
+                type=prop.get("type", "string"),
+                description=prop.get("description", ""),
+                required=name in required,
             )
-
-        return parameters
+            for name, prop in schema.get("properties", {}).items()
+        ]
 
     def as_openai_tools(
         self,
@@ -183,8 +191,6 @@ class MCPClient:
         Returns:
             List of dicts in OpenAI function calling schema format
         """
-        from ai_sdk.mcp._openai import build_openai_tools
-
         tools = self.list_tools()
         filtered = _filter_tools(tools, include, exclude)
         return build_openai_tools(filtered)
@@ -196,8 +202,6 @@ class MCPClient:
         Returns:
             Callable[[str, dict], dict] that executes tool calls
         """
-        from ai_sdk.mcp._openai import create_tool_executor
-
         return create_tool_executor(self)
 
     def as_langchain_tools(
@@ -217,6 +221,7 @@ class MCPClient:
         Returns:
             List of LangChain BaseTool instances
         """
+        # Imported lazily: langchain-core is optional and slow to import.
         from ai_sdk.mcp._langchain import build_langchain_tools
 
         tools = self.list_tools()
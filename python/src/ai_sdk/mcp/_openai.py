@@ -7,8 +7,8 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from ai_sdk.mcp._client import MCPClient
 
-from ai_sdk.exceptions import MCPToolExecutionError
-from ai_sdk.mcp.models import MCPTool, ToolInfo
+from ai_sdk.exceptions import MCPError, MCPToolExecutionError
+from ai_sdk.mcp.models import _MCP_TOOL_VALUES, ToolInfo
 
 
 def build_openai_tools(tools: list[ToolInfo]) -> list[dict]:
@@ -47,10 +47,15 @@ def create_tool_executor(mcp_client: MCPClient):
     """Create executor function for OpenAI tool calls."""
 
     def execute(tool_name: str, arguments: dict) -> dict:
-        tool = MCPTool(tool_name)
-        cleaned = {k: v for k, v in arguments.items() if v is not None}
+        if tool_name not in _MCP_TOOL_VALUES:
+            raise MCPError(f"Unknown MCP tool: {tool_name}")
+        # Only rebuild the dict when the model actually sent null arguments.
+        if arguments and any(v is None for v in arguments.values()):
+            cleaned = {k: v for k, v in arguments.items() if v is not None}
+        else:
+            cleaned = arguments
         try:
-            result = mcp_client.call_tool(tool, cleaned)
+            result = mcp_client.call_tool(tool_name, cleaned)
         except MCPToolExecutionError as exc:
             return {"error": str(exc)}
         return result.data or {}
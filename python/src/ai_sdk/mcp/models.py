@@ -30,7 +30,13 @@ class MCPTool(StrEnum):
     ROOT_CAUSE_ANALYSIS = "root_cause_analysis"
 
 
-@dataclass
+# Precomputed lookups so hot paths can resolve tool names from the server
+# without going through MCPTool(value) and its ValueError on unknown names.
+_MCP_TOOL_BY_VALUE: dict[str, MCPTool] = {tool.value: tool for tool in MCPTool}
+_MCP_TOOL_VALUES: frozenset[str] = frozenset(_MCP_TOOL_BY_VALUE)
+
+
+@dataclass(slots=True)
 class ToolParameter:
     """Schema for a tool parameter."""
 
@@ -40,7 +46,7 @@ class ToolParameter:
     required: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolInfo:
     """Metadata about an MCP tool."""
 
@@ -49,7 +55,7 @@ class ToolInfo:
     parameters: list[ToolParameter]
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCallResult:
     """Result from calling an MCP tool."""
 
@@ -1,62 +1,132 @@
 """Pytest fixtures for AI SDK tests."""
 
+from importlib.util import find_spec
+
 import pytest
 
+from ai_sdk.client import AISdk
+
+# LangChain is an optional extra. Without it, skip collecting its test modules
+# up front instead of importing each one just to skip it.
+collect_ignore_glob = (
+    [] if find_spec("langchain_core") else ["test_langchain.py", "test_mcp_langchain.py"]
+)
+
+
+# Shared clients. pytest-httpx patches the httpx transports rather than the
+# client instances, so one client per session sees each test's registered
+# responses. Async tests share a session-scoped event loop (see pyproject),
+# so the async transports can live for the whole session too.
+@pytest.fixture(scope="session")
+def client():
+    """AISdk client fixture, shared by the session."""
+    c = AISdk(
+        host="https://metadata.example.com",
+        token="test-jwt-token",
+    )
+    yield c
+    c.close()
+
+
+@pytest.fixture(scope="session")
+def no_retry_client():
+    """AISdk client with retries disabled, shared by the session.
+
+    For tests that mock single error responses. MCP tests use it through
+    ``fresh_client``, which also drops the cached MCP client.
+    """
+    c = AISdk(
+        host="https://metadata.example.com",
+        token="test-jwt-token",
+        max_retries=0,
+    )
+    yield c
+    c.close()
+
 
-# Sample agent info responses
 @pytest.fixture
+def fresh_client(no_retry_client):
+    """Session AISdk client (retries disabled) with a fresh MCP client per test."""
+    no_retry_client._mcp_client = None
+    return no_retry_client
+
+
+@pytest.fixture(scope="session")
+async def async_client():
+    """AISdk client fixture with async enabled, shared by the session."""
+    c = AISdk(
+        host="https://metadata.example.com",
+        token="test-jwt-token",
+        enable_async=True,
+    )
+    yield c
+    await c.aclose()
+    c.close()
+
+
+# Sample API payloads, built once at import. Tests only read them, so they are
+# shared as plain dicts (pytest-httpx must be able to json.dumps them).
+_SAMPLE_AGENT_INFO = {
+    "name": "DataQualityPlannerAgent",
+    "displayName": "Data Quality Planner",
+    "description": "Analyzes data quality and suggests improvements",
+    "abilities": ["search_metadata", "analyze_quality", "create_tests"],
+    "apiEnabled": True,
+}
+
+_SAMPLE_INVOKE_RESPONSE = {
+    "conversationId": "550e8400-e29b-41d4-a716-446655440000",
+    "response": "The customers table has 3 data quality issues.",
+    "toolsUsed": ["search_metadata", "analyze_quality"],
+    "usage": {
+        "promptTokens": 150,
+        "completionTokens": 50,
+        "totalTokens": 200,
+    },
+}
+
+_SAMPLE_AGENTS_LIST = {
+    "data": [
+        _SAMPLE_AGENT_INFO,
+        {
+            "name": "SqlQueryAgent",
+            "displayName": "SQL Query Agent",
+            "description": "Generates SQL queries",
+            "abilities": ["generate_sql", "explain_query"],
+            "apiEnabled": True,
+        },
+    ]
+}
+
+_SAMPLE_SSE_STREAM = (
+    b'event: stream-start\ndata: {"conversationId": "550e8400-e29b-41d4-a716-446655440000"}\n\n',
+    b'event: message\ndata: {"content": "The customers "}\n\n',
+    b'event: message\ndata: {"content": "table has "}\n\n',
+    b'event: tool-use\ndata: {"toolName": "search_metadata"}\n\n',
+    b'event: message\ndata: {"content": "3 issues."}\n\n',
+    b'event: stream-completed\ndata: {"conversationId": "550e8400-e29b-41d4-a716-446655440000"}\n\n',
+)
+
+
+@pytest.fixture(scope="session")
 def sample_agent_info_dict():
     """Sample agent info as returned by API."""
-    return {
-        "name": "DataQualityPlannerAgent",
-        "displayName": "Data Quality Planner",
-        "description": "Analyzes data quality and suggests improvements",
-        "abilities": ["search_metadata", "analyze_quality", "create_tests"],
-        "apiEnabled": True,
-    }
+    return _SAMPLE_AGENT_INFO
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_invoke_response_dict():
     """Sample invoke response as returned by API."""
-    return {
-        "conversationId": "550e8400-e29b-41d4-a716-446655440000",
-        "response": "The customers table has 3 data quality issues.",
-        "toolsUsed": ["search_metadata", "analyze_quality"],
-        "usage": {
-            "promptTokens": 150,
-            "completionTokens": 50,
-            "totalTokens": 200,
-        },
-    }
+    return _SAMPLE_INVOKE_RESPONSE
 
 
-@pytest.fixture
-def sample_agents_list_response(sample_agent_info_dict):
+@pytest.fixture(scope="session")
+def sample_agents_list_response():
     """Sample list agents response as returned by API."""
-    return {
-        "data": [
-            sample_agent_info_dict,
-            {
-                "name": "SqlQueryAgent",
-                "displayName": "SQL Query Agent",
-                "description": "Generates SQL queries",
-                "abilities": ["generate_sql", "explain_query"],
-                "apiEnabled": True,
-            },
-        ]
-    }
+    return _SAMPLE_AGENTS_LIST
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_sse_stream():
     """Sample SSE stream bytes for testing streaming."""
-    events = [
-        b'event: stream-start\ndata: {"conversationId": "550e8400-e29b-41d4-a716-446655440000"}\n\n',
-        b'event: message\ndata: {"content": "The customers "}\n\n',
-        b'event: message\ndata: {"content": "table has "}\n\n',
-        b'event: tool-use\ndata: {"toolName": "search_metadata"}\n\n',
-        b'event: message\ndata: {"content": "3 issues."}\n\n',
-        b'event: stream-completed\ndata: {"conversationId": "550e8400-e29b-41d4-a716-446655440000"}\n\n',
-    ]
-    return events
+    return _SAMPLE_SSE_STREAM
@@ -0,0 +1,47 @@
+"""JSON-RPC helpers and payloads shared by the MCP test modules."""
+
+import json
+
+import httpx
+
+MCP_URL = httpx.URL("https://metadata.example.com/mcp")
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def rpc_result(result: dict) -> bytes:
+    """Encode a JSON-RPC success envelope, for use as a mocked response body."""
+    return json.dumps({"jsonrpc": "2.0", "id": "test-id", "result": result}).encode()
+
+
+def rpc_error(error: dict) -> bytes:
+    """Encode a JSON-RPC error envelope, for use as a mocked response body."""
+    return json.dumps({"jsonrpc": "2.0", "id": "test-id", "error": error}).encode()
+
+
+def sent_rpc_call(request: httpx.Request) -> tuple[str, dict]:
+    """Return ``(method, params)`` of a sent JSON-RPC request, ignoring its id."""
+    body = json.loads(request.content)
+    return body["method"], body["params"]
+
+
+# Envelopes used by more than one module, encoded once at import.
+CUSTOMERS_RESULT_BODY = rpc_result(
+    {"content": [{"type": "text", "text": '{"tables": ["customers"]}'}]}
+)
+
+SEARCH_AND_PATCH_BODY = rpc_result(
+    {
+        "tools": [
+            {
+                "name": "search_metadata",
+                "description": "Search",
+                "inputSchema": {"type": "object", "properties": {}},
+            },
+            {
+                "name": "patch_entity",
+                "description": "Patch",
+                "inputSchema": {"type": "object", "properties": {}},
+            },
+        ]
+    }
+)
@@ -1,57 +1,114 @@
 """Tests for agent creation functionality."""
 
+import json
+from operator import attrgetter
+
 import pytest
 from pytest_httpx import HTTPXMock
 
-from ai_sdk.client import AISdk
 from ai_sdk.models import AgentInfo, CreateAgentRequest, KnowledgeScope
 
-
-@pytest.fixture
-def client():
-    """AISdk client fixture."""
-    c = AISdk(
-        host="https://metadata.example.com",
-        token="test-jwt-token",
-    )
-    yield c
-    c.close()
-
-
-@pytest.fixture
-def async_client():
-    """AISdk async client fixture."""
-    c = AISdk(
-        host="https://metadata.example.com",
-        token="test-jwt-token",
-        enable_async=True,
-    )
-    yield c
-    c.close()
-
-
-@pytest.fixture
+# Built once at import; tests only read these (pytest-httpx serializes them per
+# response), so they are plain dicts rather than read-only mapping proxies,
+# which json.dumps cannot encode.
+_SAMPLE_AGENT_RESPONSE = {
+    "name": "MyTestAgent",
+    "displayName": "My Test Agent",
+    "description": "An agent for testing",
+    "abilities": ["search_metadata", "analyze_quality"],
+    "apiEnabled": True,
+}
+
+_SAMPLE_AGENT_RESPONSE_ALL_FIELDS = {
+    "name": "FullAgent",
+    "displayName": "Full Featured Agent",
+    "description": "An agent with all configuration options",
+    "abilities": ["search_metadata", "analyze_quality", "create_tests"],
+    "apiEnabled": True,
+}
+
+
+@pytest.fixture(scope="module")
 def sample_agent_response():
     """Sample agent creation response from API."""
-    return {
-        "name": "MyTestAgent",
-        "displayName": "My Test Agent",
-        "description": "An agent for testing",
-        "abilities": ["search_metadata", "analyze_quality"],
-        "apiEnabled": True,
-    }
+    return _SAMPLE_AGENT_RESPONSE
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_agent_response_all_fields():
     """Sample agent creation response with all fields from API."""
-    return {
-        "name": "FullAgent",
-        "displayName": "Full Featured Agent",
-        "description": "An agent with all configuration options",
-        "abilities": ["search_metadata", "analyze_quality", "create_tests"],
-        "apiEnabled": True,
-    }
+    return _SAMPLE_AGENT_RESPONSE_ALL_FIELDS
+
+
+_AGENTS_URL = "https://metadata.example.com/api/v1/agents"
+
+_DATA_ANALYST_PERSONA = {
+    "id": "persona-123",
+    "name": "DataAnalyst",
+    "displayName": "Data Analyst",
+    "provider": "system",
+}
+
+
+def _mock_create_routes(
+    httpx_mock: HTTPXMock,
+    response: dict,
+    persona: dict = _DATA_ANALYST_PERSONA,
+    abilities: tuple[str, ...] = (),
+) -> None:
+    """Register the persona, ability and create routes used by create_agent."""
+    httpx_mock.add_response(
+        url=f"{_AGENTS_URL}/personas/name/{persona['name']}",
+        method="GET",
+        json=persona,
+    )
+    for i, ability in enumerate(abilities, start=1):
+        httpx_mock.add_response(
+            url=f"{_AGENTS_URL}/abilities/name/{ability}",
+            method="GET",
+            json={"id": f"ability-{i}", "name": ability, "tools": []},
+        )
+    httpx_mock.add_response(url=f"{_AGENTS_URL}/dynamic/", method="POST", json=response)
+
+
+@pytest.fixture(scope="module")
+def full_request():
+    """CreateAgentRequest with every field set, built once per module."""
+    return CreateAgentRequest(
+        name="FullAgent",
+        description="Full featured agent",
+        persona="DataAnalyst",
+        mode="agent",
+        display_name="Full Featured Agent",
+        icon="bot-icon",
+        bot_name="my-bot",
+        abilities=["search", "analyze"],
+        knowledge=KnowledgeScope(entity_types=["table", "database"]),
+        prompt="workflow: step1 -> step2",
+        schedule="0 0 * * *",
+        api_enabled=True,
+        provider="user",
+    )
+
+
+@pytest.fixture(scope="module")
+def full_api_dict():
+    """to_api_dict output for a request with every field set."""
+    request = CreateAgentRequest(
+        name="FullAgent",
+        description="Full agent",
+        persona="Analyst",
+        mode="both",
+        display_name="Full Agent",
+        icon="robot",
+        bot_name="test-bot",
+        abilities=["search"],
+        knowledge=KnowledgeScope(entity_types=["table"]),
+        prompt="workflow",
+        schedule="* * * * *",
+        api_enabled=True,
+    )
+    return request.to_api_dict()
 
 
 class TestCreateAgentRequest:
@@ -72,36 +129,27 @@ class TestCreateAgentRequest:
         assert request.mode == "chat"
         assert request.api_enabled is False  # Default value
 
-    def test_request_with_all_fields(self):
+    @pytest.mark.parametrize(
+        ("attr", "expected"),
+        [
+            ("name", "FullAgent"),
+            ("display_name", "Full Featured Agent"),
+            ("icon", "bot-icon"),
+            ("bot_name", "my-bot"),
+            ("abilities", ["search", "analyze"]),
+            ("knowledge.entity_types", ["table", "database"]),
+            ("prompt", "workflow: step1 -> step2"),
+            ("schedule", "0 0 * * *"),
+            ("api_enabled", True),
+            ("provider", "user"),
+        ],
+    )
+    def test_request_with_all_fields(self, full_request, attr, expected):
         """CreateAgentRequest works with all fields."""
-        knowledge = KnowledgeScope(entity_types=["table", "database"])
-        request = CreateAgentRequest(
-            name="FullAgent",
-            description="Full featured agent",
-            persona="DataAnalyst",
-            mode="agent",
-            display_name="Full Featured Agent",
-            icon="bot-icon",
-            bot_name="my-bot",
-            abilities=["search", "analyze"],
-            knowledge=knowledge,
-            prompt="workflow: step1 -> step2",
-            schedule="0 0 * * *",
-            api_enabled=True,
-            provider="user",
-        )
+        value = attrgetter(attr)(full_request)
 
-        assert request.name == "FullAgent"
-        assert request.display_name == "Full Featured Agent"
-        assert request.icon == "bot-icon"
-        assert request.bot_name == "my-bot"
-        assert request.abilities == ["search", "analyze"]
-        assert request.knowledge is not None
-        assert request.knowledge.entity_types == ["table", "database"]
-        assert request.prompt == "workflow: step1 -> step2"
-        assert request.schedule == "0 0 * * *"
-        assert request.api_enabled is True
-        assert request.provider == "user"
+        assert value == expected
+        assert type(value) is type(expected)
 
     def test_to_api_dict_minimal(self):
         """to_api_dict produces correct output for minimal request."""
@@ -128,34 +176,23 @@ class TestCreateAgentRequest:
         assert "icon" not in api_dict
         assert "botName" not in api_dict
 
-    def test_to_api_dict_all_fields(self):
+    @pytest.mark.parametrize(
+        ("key", "expected"),
+        [
+            ("displayName", "Full Agent"),
+            ("icon", "robot"),
+            ("botName", "test-bot"),
+            ("abilities", ["search"]),
+            ("knowledge", {"entityTypes": ["table"]}),
+            ("prompt", "workflow"),
+            ("schedule", "* * * * *"),
+            ("apiEnabled", True),
+        ],
+    )
+    def test_to_api_dict_all_fields(self, full_api_dict, key, expected):
         """to_api_dict produces correct output with all fields."""
-        knowledge = KnowledgeScope(entity_types=["table"])
-        request = CreateAgentRequest(
-            name="FullAgent",
-            description="Full agent",
-            persona="Analyst",
-            mode="both",
-            display_name="Full Agent",
-            icon="robot",
-            bot_name="test-bot",
-            abilities=["search"],
-            knowledge=knowledge,
-            prompt="workflow",
-            schedule="* * * * *",
-            api_enabled=True,
-        )
-
-        api_dict = request.to_api_dict()
-
-        assert api_dict["displayName"] == "Full Agent"
-        assert api_dict["icon"] == "robot"
-        assert api_dict["botName"] == "test-bot"
-        assert api_dict["abilities"] == ["search"]
-        assert api_dict["knowledge"] == {"entityTypes": ["table"]}
-        assert api_dict["prompt"] == "workflow"
-        assert api_dict["schedule"] == "* * * * *"
-        assert api_dict["apiEnabled"] is True
+        assert full_api_dict[key] == expected
+        assert type(full_api_dict[key]) is type(expected)
 
 
 class TestCreateAgent:
@@ -163,22 +200,7 @@ class TestCreateAgent:
 
     def test_create_agent_minimal(self, client, httpx_mock: HTTPXMock, sample_agent_response):
         """create_agent works with minimal fields."""
-        # Mock persona resolution
-        httpx_mock.add_response(
-            url="https://metadata.example.com/api/v1/agents/personas/name/DataAnalyst",
-            method="GET",
-            json={
-                "id": "persona-123",
-                "name": "DataAnalyst",
-                "displayName": "Data Analyst",
-                "provider": "system",
-            },
-        )
-        httpx_mock.add_response(
-            url="https://metadata.example.com/api/v1/agents/dynamic/",
-            method="POST",
-            json=sample_agent_response,
-        )
+        _mock_create_routes(httpx_mock, sample_agent_response)
 
         request = CreateAgentRequest(
             name="MyTestAgent",
@@ -198,37 +220,10 @@ class TestCreateAgent:
         self, client, httpx_mock: HTTPXMock, sample_agent_response_all_fields
     ):
         """create_agent works with all fields."""
-        # Mock persona resolution
-        httpx_mock.add_response(
-            url="https://metadata.example.com/api/v1/agents/personas/name/DataAnalyst",
-            method="GET",
-            json={
-                "id": "persona-123",
-                "name": "DataAnalyst",
-                "displayName": "Data Analyst",
-                "provider": "system",
-            },
-        )
-        # Mock ability resolution
-        httpx_mock.add_response(
-            url="https://metadata.example.com/api/v1/agents/abilities/name/search_metadata",
-            method="GET",
-            json={"id": "ability-1", "name": "search_metadata", "tools": []},
-        )
-        httpx_mock.add_response(
-            url="https://metadata.example.com/api/v1/agents/abilities/name/analyze_quality",
-            method="GET",
-            json={"id": "ability-2", "name": "analyze_quality", "tools": []},
-        )
-        httpx_mock.add_response(
-            url="https://metadata.example.com/api/v1/agents/abilities/name/create_tests",
-            method="GET",
-            json={"id": "ability-3", "name": "create_tests", "tools": []},
-        )
-        httpx_mock.add_response(
-            url="https://metadata.example.com/api/v1/agents/dynamic/",
-            method="POST",
-            json=sample_agent_response_all_fields,
+        _mock_create_routes(
+            httpx_mock,
+            sample_agent_response_all_fields,
+            abilities=("search_metadata", "analyze_quality", "create_tests"),
         )
 
         knowledge = KnowledgeScope(entity_types=["table", "database"])
@@ -255,22 +250,16 @@ class TestCreateAgent:
 
     def test_create_agent_sends_correct_body(self, client, httpx_mock: HTTPXMock):
         """create_agent sends correct request body with resolved persona ID."""
-        # Mock persona resolution
-        httpx_mock.add_response(
-            url="https://metadata.example.com/api/v1/agents/personas/name/TestPersona",
-            method="GET",
-            json={
+        _mock_create_routes(
+            httpx_mock,
+            {"name": "TestAgent", "displayName": "TestAgent", "apiEnabled": True},
+            persona={
                 "id": "persona-456",
                 "name": "TestPersona",
                 "displayName": "Test Persona",
                 "provider": "user",
             },
         )
-        httpx_mock.add_response(
-            url="https://metadata.example.com/api/v1/agents/dynamic/",
-            method="POST",
-            json={"name": "TestAgent", "displayName": "TestAgent", "apiEnabled": True},
-        )
 
         request = CreateAgentRequest(
             name="TestAgent",
@@ -285,8 +274,6 @@ class TestCreateAgent:
         requests = httpx_mock.get_requests()
         post_request = next(r for r in requests if r.method == "POST")
 
-        import json
-
         body = json.loads(post_request.content)
         assert body["name"] == "TestAgent"
         assert body["description"] == "Test description"
@@ -302,22 +289,7 @@ class TestAsyncCreateAgent:
     @pytest.mark.asyncio
     async def test_acreate_agent(self, async_client, httpx_mock: HTTPXMock, sample_agent_response):
         """acreate_agent works correctly."""
-        # Mock persona resolution
-        httpx_mock.add_response(
-            url="https://metadata.example.com/api/v1/agents/personas/name/DataAnalyst",
-            method="GET",
-            json={
-                "id": "persona-123",
-                "name": "DataAnalyst",
-                "displayName": "Data Analyst",
-                "provider": "system",
-            },
-        )
-        httpx_mock.add_response(
-            url="https://metadata.example.com/api/v1/agents/dynamic/",
-            method="POST",
-            json=sample_agent_response,
-        )
+        _mock_create_routes(httpx_mock, sample_agent_response)
 
         request = CreateAgentRequest(
             name="MyTestAgent",
@@ -13,24 +13,12 @@ from ai_sdk.exceptions import AuthenticationError
 from ai_sdk.models import AgentInfo, InvokeResponse
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def auth():
     """Token auth fixture."""
     return TokenAuth("test-jwt-token")
 
 
-@pytest.fixture
-def async_client():
-    """Async AISdk client fixture."""
-    c = AISdk(
-        host="https://metadata.example.com",
-        token="test-jwt-token",
-        enable_async=True,
-    )
-    yield c
-    c.close()
-
-
 class TestAsyncHTTPClient:
     """Tests for AsyncHTTPClient."""
 
@@ -167,12 +155,11 @@ class TestAsyncSSEIterator:
 
         events = [event async for event in AsyncSSEIterator(mock_stream())]
 
-        assert len(events) == 3
-        assert events[0].type == "start"
-        assert events[0].conversation_id == "conv-1"
-        assert events[1].type == "content"
-        assert events[1].content == "Hello"
-        assert events[2].type == "end"
+        assert [(e.type, e.content, e.conversation_id) for e in events] == [
+            ("start", None, "conv-1"),
+            ("content", "Hello", None),
+            ("end", None, None),
+        ]
 
     @pytest.mark.asyncio
     async def test_handles_chunked_stream(self):
@@ -1,70 +1,67 @@
 """Test that async streaming works correctly."""
 
+from collections.abc import AsyncIterator, Callable, Iterable
 from unittest.mock import MagicMock
 
 import pytest
 
+from ai_sdk._http import AsyncHTTPClient, HTTPClient
 from ai_sdk.agent import AgentHandle
 
+_SSE_START_HELLO_END: tuple[bytes, ...] = (
+    b'event: stream-start\ndata: {"conversationId": "test-123"}\n\n',
+    b'event: message\ndata: {"content": "Hello"}\n\n',
+    b'event: stream-completed\ndata: {"conversationId": "test-123"}\n\n',
+)
 
-class MockAsyncByteStream:
-    """Mock async byte stream that yields SSE events."""
+_SSE_WITH_TOOL_USE: tuple[bytes, ...] = (
+    b'event: stream-start\ndata: {"conversationId": "test-123"}\n\n',
+    b'event: message\ndata: {"content": "Hello "}\n\n',
+    b'event: tool-use\ndata: {"toolName": "search"}\n\n',
+    b'event: message\ndata: {"content": "world"}\n\n',
+    b'event: stream-completed\ndata: {"conversationId": "test-123"}\n\n',
+)
 
-    def __init__(self, events: list[bytes]):
-        self._events = iter(events)
 
-    def __aiter__(self):
-        return self
+async def mock_async_byte_stream(events: Iterable[bytes]) -> AsyncIterator[bytes]:
+    """Mock async byte stream that yields SSE events, like AsyncHTTPClient.post_stream."""
+    for event in events:
+        yield event
 
-    async def __anext__(self) -> bytes:
-        try:
-            return next(self._events)
-        except StopIteration:
-            raise StopAsyncIteration
 
+@pytest.fixture
+def agent_factory() -> Callable[[Iterable[bytes]], AgentHandle]:
+    """Build an AgentHandle whose async HTTP client streams the given SSE bytes."""
+    mock_http = MagicMock(spec=HTTPClient)
+    mock_async_http = MagicMock(spec=AsyncHTTPClient)
 
-@pytest.mark.asyncio
-async def test_astream_is_async_iterable():
-    """Test that astream returns something that works with async for."""
-    mock_http = MagicMock()
-    mock_async_http = MagicMock()
+    def make(sse_data: Iterable[bytes]) -> AgentHandle:
+        mock_async_http.post_stream.return_value = mock_async_byte_stream(sse_data)
+        return AgentHandle(name="TestAgent", http=mock_http, async_http=mock_async_http)
 
-    sse_data = [
-        b'event: stream-start\ndata: {"conversationId": "test-123"}\n\n',
-        b'event: message\ndata: {"content": "Hello"}\n\n',
-        b'event: stream-completed\ndata: {"conversationId": "test-123"}\n\n',
-    ]
-    mock_async_http.post_stream.return_value = MockAsyncByteStream(sse_data)
+    return make
 
-    agent = AgentHandle(name="TestAgent", http=mock_http, async_http=mock_async_http)
+
+@pytest.mark.asyncio
+async def test_astream_is_async_iterable(agent_factory):
+    """Test that astream returns something that works with async for."""
+    agent = agent_factory(_SSE_START_HELLO_END)
 
     events = []
     async for event in agent.astream("test message"):
         events.append(event)
 
-    assert len(events) == 3
-    assert events[0].type == "start"
-    assert events[1].type == "content"
-    assert events[1].content == "Hello"
-    assert events[2].type == "end"
+    assert [(e.type, e.content) for e in events] == [
+        ("start", None),
+        ("content", "Hello"),
+        ("end", None),
+    ]
 
 
 @pytest.mark.asyncio
-async def test_astream_content_yields_only_strings():
+async def test_astream_content_yields_only_strings(agent_factory):
     """Test that astream_content yields only content strings."""
-    mock_http = MagicMock()
-    mock_async_http = MagicMock()
-
-    sse_data = [
-        b'event: stream-start\ndata: {"conversationId": "test-123"}\n\n',
-        b'event: message\ndata: {"content": "Hello "}\n\n',
-        b'event: tool-use\ndata: {"toolName": "search"}\n\n',
-        b'event: message\ndata: {"content": "world"}\n\n',
-        b'event: stream-completed\ndata: {"conversationId": "test-123"}\n\n',
-    ]
-    mock_async_http.post_stream.return_value = MockAsyncByteStream(sse_data)
-
-    agent = AgentHandle(name="TestAgent", http=mock_http, async_http=mock_async_http)
+    agent = agent_factory(_SSE_WITH_TOOL_USE)
 
     chunks = []
     async for chunk in agent.astream_content("test message"):
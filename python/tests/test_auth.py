@@ -4,6 +4,9 @@ import pytest
 
 from ai_sdk.auth import TokenAuth
 
+# TokenAuth holds no mutable state, so one instance serves every test
+_AUTH = TokenAuth("my-jwt-token")
+
 
 class TestTokenAuth:
     """Tests for TokenAuth."""
@@ -15,7 +18,7 @@ class TestTokenAuth:
 
     def test_get_headers_returns_bearer_format(self):
         """get_headers returns properly formatted Bearer token."""
-        auth = TokenAuth("my-jwt-token")
-        headers = auth.get_headers()
+        headers = _AUTH.get_headers()
 
-        assert headers == {"Authorization": "Bearer my-jwt-token"}
+        assert len(headers) == 1
+        assert headers["Authorization"] == "Bearer my-jwt-token"
@@ -1,82 +1,90 @@
 """Tests for bot operations in the AI SDK."""
 
+import inspect
+
+import httpx
 import pytest
 from pytest_httpx import HTTPXMock
 
-from ai_sdk.client import AISdk
 from ai_sdk.exceptions import BotNotFoundError
 from ai_sdk.models import BotInfo
 
-
-@pytest.fixture
-def client():
-    """AISdk client fixture."""
-    c = AISdk(
-        host="https://metadata.example.com",
-        token="test-jwt-token",
-    )
-    yield c
-    c.close()
-
-
-@pytest.fixture
-def async_client():
-    """AISdk async client fixture."""
-    c = AISdk(
-        host="https://metadata.example.com",
-        token="test-jwt-token",
-        enable_async=True,
+# Parsed once at import; pytest-httpx matches httpx.URL objects directly.
+_BOTS_LIST_URL = httpx.URL("https://metadata.example.com/api/v1/bots/?limit=100")
+_INGESTION_BOT_URL = httpx.URL("https://metadata.example.com/api/v1/bots/name/ingestion-bot")
+_MISSING_BOT_URL = httpx.URL("https://metadata.example.com/api/v1/bots/name/nonexistent-bot")
+
+# Built once at import; tests only read these. They stay plain dicts (not
+# mapping proxies) because pytest-httpx JSON-encodes them per response.
+_SAMPLE_BOT_INFO = {
+    "id": "550e8400-e29b-41d4-a716-446655440000",
+    "name": "ingestion-bot",
+    "displayName": "Ingestion Bot",
+    "description": "Bot for data ingestion pipelines",
+    "botUser": {
+        "id": "user-123",
+        "name": "ingestion-bot-user",
+        "type": "user",
+    },
+}
+
+_SAMPLE_BOTS_LIST = {
+    "data": (
+        _SAMPLE_BOT_INFO,
+        {
+            "id": "660e8400-e29b-41d4-a716-446655440001",
+            "name": "dq-bot",
+            "displayName": "Data Quality Bot",
+            "description": "Bot for data quality operations",
+            "botUser": None,
+        },
     )
-    yield c
-    c.close()
+}
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_bot_info_dict():
     """Sample bot info as returned by API."""
-    return {
-        "id": "550e8400-e29b-41d4-a716-446655440000",
-        "name": "ingestion-bot",
-        "displayName": "Ingestion Bot",
-        "description": "Bot for data ingestion pipelines",
-        "botUser": {
-            "id": "user-123",
-            "name": "ingestion-bot-user",
-            "type": "user",
-        },
-    }
+    return _SAMPLE_BOT_INFO
 
 
-@pytest.fixture
-def sample_bots_list_response(sample_bot_info_dict):
+@pytest.fixture(scope="module")
+def sample_bots_list_response():
     """Sample list bots response as returned by API."""
-    return {
-        "data": [
-            sample_bot_info_dict,
-            {
-                "id": "660e8400-e29b-41d4-a716-446655440001",
-                "name": "dq-bot",
-                "displayName": "Data Quality Bot",
-                "description": "Bot for data quality operations",
-                "botUser": None,
-            },
-        ]
-    }
+    return _SAMPLE_BOTS_LIST
+
+
+async def _maybe_await(result):
+    """Await ``result`` if it came from an async method."""
+    return await result if inspect.isawaitable(result) else result
+
+
+@pytest.fixture(params=["sync", "async"])
+def list_bots(request, client, async_client):
+    """client.list_bots or async_client.alist_bots."""
+    return client.list_bots if request.param == "sync" else async_client.alist_bots
+
+
+@pytest.fixture(params=["sync", "async"])
+def get_bot(request, client, async_client):
+    """client.get_bot or async_client.aget_bot."""
+    return client.get_bot if request.param == "sync" else async_client.aget_bot
 
 
 class TestListBots:
-    """Tests for AISdk.list_bots() method."""
+    """Tests for AISdk.list_bots() and alist_bots()."""
 
-    def test_list_bots_returns_bot_info(
-        self, client, httpx_mock: HTTPXMock, sample_bots_list_response
+    @pytest.mark.asyncio
+    async def test_list_bots_returns_bot_info(
+        self, list_bots, httpx_mock: HTTPXMock, sample_bots_list_response
     ):
         """list_bots returns list of BotInfo objects."""
         httpx_mock.add_response(
-            url="https://metadata.example.com/api/v1/bots/?limit=100",
+            url=_BOTS_LIST_URL,
             json=sample_bots_list_response,
         )
 
-        bots = client.list_bots()
+        bots = await _maybe_await(list_bots())
 
         assert len(bots) == 2
         assert all(isinstance(b, BotInfo) for b in bots)
@@ -87,7 +95,7 @@ class TestListBots:
     def test_list_bots_with_limit(self, client, httpx_mock: HTTPXMock, sample_bots_list_response):
         """list_bots respects user limit parameter."""
         httpx_mock.add_response(
-            url="https://metadata.example.com/api/v1/bots/?limit=100",
+            url=_BOTS_LIST_URL,
             json=sample_bots_list_response,
         )
 
@@ -100,7 +108,7 @@ class TestListBots:
     def test_list_bots_empty_response(self, client, httpx_mock: HTTPXMock):
         """list_bots handles empty response."""
         httpx_mock.add_response(
-            url="https://metadata.example.com/api/v1/bots/?limit=100",
+            url=_BOTS_LIST_URL,
             json={"data": []},
         )
 
@@ -108,59 +116,6 @@ class TestListBots:
 
         assert bots == []
 
-
-class TestGetBot:
-    """Tests for AISdk.get_bot() method."""
-
-    def test_get_bot_returns_bot_info(self, client, httpx_mock: HTTPXMock, sample_bot_info_dict):
-        """get_bot returns BotInfo object."""
-        httpx_mock.add_response(
-            url="https://metadata.example.com/api/v1/bots/name/ingestion-bot",
-            json=sample_bot_info_dict,
-        )
-
-        bot = client.get_bot("ingestion-bot")
-
-        assert isinstance(bot, BotInfo)
-        assert bot.name == "ingestion-bot"
-        assert bot.display_name == "Ingestion Bot"
-        assert bot.description == "Bot for data ingestion pipelines"
-        assert bot.bot_user is not None
-
-    def test_get_bot_not_found(self, client, httpx_mock: HTTPXMock):
-        """get_bot raises BotNotFoundError on 404."""
-        httpx_mock.add_response(
-            url="https://metadata.example.com/api/v1/bots/name/nonexistent-bot",
-            status_code=404,
-            json={"message": "Bot not found"},
-        )
-
-        with pytest.raises(BotNotFoundError) as exc_info:
-            client.get_bot("nonexistent-bot")
-
-        assert exc_info.value.bot_name == "nonexistent-bot"
-        assert exc_info.value.status_code == 404
-
-
-class TestAsyncListBots:
-    """Tests for AISdk.alist_bots() method."""
-
-    @pytest.mark.asyncio
-    async def test_alist_bots_returns_bot_info(
-        self, async_client, httpx_mock: HTTPXMock, sample_bots_list_response
-    ):
-        """alist_bots returns list of BotInfo objects."""
-        httpx_mock.add_response(
-            url="https://metadata.example.com/api/v1/bots/?limit=100",
-            json=sample_bots_list_response,
-        )
-
-        bots = await async_client.alist_bots()
-
-        assert len(bots) == 2
-        assert all(isinstance(b, BotInfo) for b in bots)
-        assert bots[0].name == "ingestion-bot"
-
     @pytest.mark.asyncio
     async def test_alist_bots_without_async_enabled(self, client, httpx_mock: HTTPXMock):
         """alist_bots raises RuntimeError when async not enabled."""
@@ -170,37 +125,41 @@ class TestAsyncListBots:
         assert "enable_async=True" in str(exc_info.value)
 
 
-class TestAsyncGetBot:
-    """Tests for AISdk.aget_bot() method."""
+class TestGetBot:
+    """Tests for AISdk.get_bot() and aget_bot()."""
 
     @pytest.mark.asyncio
-    async def test_aget_bot_returns_bot_info(
-        self, async_client, httpx_mock: HTTPXMock, sample_bot_info_dict
+    async def test_get_bot_returns_bot_info(
+        self, get_bot, httpx_mock: HTTPXMock, sample_bot_info_dict
     ):
-        """aget_bot returns BotInfo object."""
+        """get_bot returns BotInfo object."""
         httpx_mock.add_response(
-            url="https://metadata.example.com/api/v1/bots/name/ingestion-bot",
+            url=_INGESTION_BOT_URL,
             json=sample_bot_info_dict,
         )
 
-        bot = await async_client.aget_bot("ingestion-bot")
+        bot = await _maybe_await(get_bot("ingestion-bot"))
 
         assert isinstance(bot, BotInfo)
         assert bot.name == "ingestion-bot"
+        assert bot.display_name == "Ingestion Bot"
+        assert bot.description == "Bot for data ingestion pipelines"
+        assert bot.bot_user is not None
 
     @pytest.mark.asyncio
-    async def test_aget_bot_not_found(self, async_client, httpx_mock: HTTPXMock):
-        """aget_bot raises BotNotFoundError on 404."""
+    async def test_get_bot_not_found(self, get_bot, httpx_mock: HTTPXMock):
+        """get_bot raises BotNotFoundError on 404."""
         httpx_mock.add_response(
-            url="https://metadata.example.com/api/v1/bots/name/nonexistent-bot",
+            url=_MISSING_BOT_URL,
             status_code=404,
             json={"message": "Bot not found"},
         )
 
         with pytest.raises(BotNotFoundError) as exc_info:
-            await async_client.aget_bot("nonexistent-bot")
+            await _maybe_await(get_bot("nonexistent-bot"))
 
         assert exc_info.value.bot_name == "nonexistent-bot"
+        assert exc_info.value.status_code == 404
 
     @pytest.mark.asyncio
     async def test_aget_bot_without_async_enabled(self, client, httpx_mock: HTTPXMock):
@@ -1,6 +1,5 @@
 """Tests for the AI SDK client."""
 
-import pytest
 from pytest_httpx import HTTPXMock
 
 from ai_sdk.agent import AgentHandle
@@ -8,17 +7,6 @@ from ai_sdk.client import AISdk
 from ai_sdk.models import AgentInfo
 
 
-@pytest.fixture
-def client():
-    """AISdk client fixture."""
-    c = AISdk(
-        host="https://metadata.example.com",
-        token="test-jwt-token",
-    )
-    yield c
-    c.close()
-
-
 class TestAISdkInit:
     """Tests for AISdk initialization."""
 
@@ -1,7 +1,11 @@
 """Tests for the AISdkConfig configuration module."""
 
+import os
+from unittest.mock import patch
+
 import pytest
 
+from ai_sdk.client import AISdk
 from ai_sdk.config import AISdkConfig
 
 
@@ -27,33 +31,42 @@ class TestAISdkConfigInit:
         config = AISdkConfig(host="https://metadata.example.com/", token="test-token")
         assert config.host == "https://metadata.example.com"
 
-    def test_validation_errors(self):
+    @pytest.mark.parametrize(
+        ("kwargs", "message"),
+        [
+            ({"host": "", "token": "test-token"}, "host cannot be empty"),
+            ({"host": "https://example.com", "token": ""}, "token cannot be empty"),
+            (
+                {"host": "https://example.com", "token": "test", "timeout": -1},
+                "timeout must be positive",
+            ),
+            (
+                {"host": "https://example.com", "token": "test", "max_retries": -1},
+                "max_retries cannot be negative",
+            ),
+        ],
+        ids=["empty-host", "empty-token", "negative-timeout", "negative-max-retries"],
+    )
+    def test_validation_errors(self, kwargs, message):
         """Config validates required fields and constraints."""
-        with pytest.raises(ValueError, match="host cannot be empty"):
-            AISdkConfig(host="", token="test-token")
-
-        with pytest.raises(ValueError, match="token cannot be empty"):
-            AISdkConfig(host="https://example.com", token="")
-
-        with pytest.raises(ValueError, match="timeout must be positive"):
-            AISdkConfig(host="https://example.com", token="test", timeout=-1)
-
-        with pytest.raises(ValueError, match="max_retries cannot be negative"):
-            AISdkConfig(host="https://example.com", token="test", max_retries=-1)
+        with pytest.raises(ValueError, match=message):
+            AISdkConfig(**kwargs)
 
 
 class TestAISdkConfigFromEnv:
     """Tests for AISdkConfig.from_env()."""
 
-    def test_from_env_reads_env_vars(self, monkeypatch):
+    def test_from_env_reads_env_vars(self):
         """from_env reads required and optional env vars."""
-        monkeypatch.setenv("AI_SDK_HOST", "https://metadata.example.com")
-        monkeypatch.setenv("AI_SDK_TOKEN", "env-token")
-        monkeypatch.setenv("AI_SDK_TIMEOUT", "60")
-        monkeypatch.setenv("AI_SDK_VERIFY_SSL", "false")
-        monkeypatch.setenv("AI_SDK_DEBUG", "true")
-
-        config = AISdkConfig.from_env()
+        env = {
+            "AI_SDK_HOST": "https://metadata.example.com",
+            "AI_SDK_TOKEN": "env-token",
+            "AI_SDK_TIMEOUT": "60",
+            "AI_SDK_VERIFY_SSL": "false",
+            "AI_SDK_DEBUG": "true",
+        }
+        with patch.dict(os.environ, env):
+            config = AISdkConfig.from_env()
 
         assert config.host == "https://metadata.example.com"
         assert config.token == "env-token"
@@ -61,23 +74,24 @@ class TestAISdkConfigFromEnv:
         assert config.verify_ssl is False
         assert config.debug is True
 
-    def test_from_env_custom_prefix(self, monkeypatch):
+    def test_from_env_custom_prefix(self):
         """from_env supports custom prefix."""
-        monkeypatch.setenv("MY_APP_HOST", "https://my.example.com")
-        monkeypatch.setenv("MY_APP_TOKEN", "my-token")
-
-        config = AISdkConfig.from_env(prefix="MY_APP")
+        env = {"MY_APP_HOST": "https://my.example.com", "MY_APP_TOKEN": "my-token"}
+        with patch.dict(os.environ, env):
+            config = AISdkConfig.from_env(prefix="MY_APP")
 
         assert config.host == "https://my.example.com"
         assert config.token == "my-token"
 
-    def test_from_env_with_overrides(self, monkeypatch):
+    def test_from_env_with_overrides(self):
         """from_env allows explicit overrides over env vars."""
-        monkeypatch.setenv("AI_SDK_HOST", "https://env.example.com")
-        monkeypatch.setenv("AI_SDK_TOKEN", "env-token")
-        monkeypatch.setenv("AI_SDK_TIMEOUT", "60")
-
-        config = AISdkConfig.from_env(timeout=30.0)
+        env = {
+            "AI_SDK_HOST": "https://env.example.com",
+            "AI_SDK_TOKEN": "env-token",
+            "AI_SDK_TIMEOUT": "60",
+        }
+        with patch.dict(os.environ, env):
+            config = AISdkConfig.from_env(timeout=30.0)
 
         assert config.timeout == 30.0  # Override takes precedence
 
@@ -118,26 +132,34 @@ class TestAISdkConfigWithOverrides:
 class TestAISdkConfigUserAgent:
     """Tests for user_agent configuration."""
 
-    def test_user_agent_passed_through_from_config(self):
-        """Test that user_agent from config is passed to HTTP clients."""
-        from ai_sdk.client import AISdk
-
+    @pytest.mark.parametrize(
+        ("enable_async", "expected_clients"),
+        [(False, 4), (True, 8)],
+        ids=["sync", "sync-and-async"],
+    )
+    def test_user_agent_passed_through_from_config(self, enable_async, expected_clients):
+        """Test that user_agent from config is passed to every HTTP client."""
         config = AISdkConfig(
             host="https://test.com",
             token="test-token",
             user_agent="my-custom-agent/1.0",
+            enable_async=enable_async,
         )
 
-        client = AISdk.from_config(config)
+        with (
+            patch("ai_sdk.client.HTTPClient") as http_cls,
+            patch("ai_sdk.client.AsyncHTTPClient") as async_http_cls,
+        ):
+            AISdk.from_config(config)
 
-        assert client._http._user_agent == "my-custom-agent/1.0"
-        assert client._personas_http._user_agent == "my-custom-agent/1.0"
-        assert client._bots_http._user_agent == "my-custom-agent/1.0"
+        # agents, personas, bots and abilities clients (x2 with async enabled)
+        calls = http_cls.call_args_list + async_http_cls.call_args_list
+        assert len(calls) == expected_clients
+        for call in calls:
+            assert call.kwargs["user_agent"] == "my-custom-agent/1.0"
 
     def test_user_agent_default_when_not_specified(self):
         """Test that default user_agent is used when not specified."""
-        from ai_sdk.client import AISdk
-
         config = AISdkConfig(
             host="https://test.com",
             token="test-token",
@@ -148,29 +170,14 @@ class TestAISdkConfigUserAgent:
         # Default user agent should be used
         assert "ai-sdk-python" in client._http._user_agent
 
-    def test_user_agent_from_env(self, monkeypatch):
+    def test_user_agent_from_env(self):
         """Test that user_agent can be set from environment variable."""
-        monkeypatch.setenv("AI_SDK_HOST", "https://test.com")
-        monkeypatch.setenv("AI_SDK_TOKEN", "test-token")
-        monkeypatch.setenv("AI_SDK_USER_AGENT", "env-custom-agent/2.0")
-
-        config = AISdkConfig.from_env()
+        env = {
+            "AI_SDK_HOST": "https://test.com",
+            "AI_SDK_TOKEN": "test-token",
+            "AI_SDK_USER_AGENT": "env-custom-agent/2.0",
+        }
+        with patch.dict(os.environ, env):
+            config = AISdkConfig.from_env()
 
         assert config.user_agent == "env-custom-agent/2.0"
-
-    def test_user_agent_passed_to_async_clients(self):
-        """Test that user_agent is passed to async HTTP clients when enabled."""
-        from ai_sdk.client import AISdk
-
-        config = AISdkConfig(
-            host="https://test.com",
-            token="test-token",
-            user_agent="async-custom-agent/1.0",
-            enable_async=True,
-        )
-
-        client = AISdk.from_config(config)
-
-        assert client._async_http._user_agent == "async-custom-agent/1.0"
-        assert client._async_personas_http._user_agent == "async-custom-agent/1.0"
-        assert client._async_bots_http._user_agent == "async-custom-agent/1.0"
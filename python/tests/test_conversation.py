@@ -8,10 +8,15 @@ from pytest_httpx import HTTPXMock
 from ai_sdk.client import AISdk
 from ai_sdk.conversation import Conversation
 
+_INVOKE_URL = "https://metadata.example.com/api/v1/agents/dynamic/name/TestAgent/invoke"
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def client():
-    """AISdk client fixture with retries disabled."""
+    """AISdk client fixture with retries disabled, shared by the module.
+
+    Conversations hold the per-test state, so each test builds its own.
+    """
     c = AISdk(
         host="https://metadata.example.com",
         token="test-jwt-token",
@@ -21,19 +26,25 @@ def client():
     c.close()
 
 
+@pytest.fixture
+def invoke_mock(httpx_mock: HTTPXMock):
+    """Register a TestAgent invoke response; call once per expected request."""
+
+    def add(response: str, conversation_id: str = "conv-123") -> None:
+        httpx_mock.add_response(
+            url=_INVOKE_URL,
+            json={"conversationId": conversation_id, "response": response, "toolsUsed": []},
+        )
+
+    return add
+
+
 class TestConversationSend:
     """Tests for Conversation.send()."""
 
-    def test_send_returns_response_and_stores_id(self, client, httpx_mock: HTTPXMock):
+    def test_send_returns_response_and_stores_id(self, client, invoke_mock):
         """send() returns response text and stores conversation ID."""
-        httpx_mock.add_response(
-            url="https://metadata.example.com/api/v1/agents/dynamic/name/TestAgent/invoke",
-            json={
-                "conversationId": "conv-123",
-                "response": "Hello, this is the response.",
-                "toolsUsed": [],
-            },
-        )
+        invoke_mock("Hello, this is the response.")
 
         agent = client.agent("TestAgent")
         conv = Conversation(agent)
@@ -44,16 +55,10 @@ class TestConversationSend:
         assert result == "Hello, this is the response."
         assert conv.id == "conv-123"
 
-    def test_send_uses_stored_conversation_id(self, client, httpx_mock: HTTPXMock):
+    def test_send_uses_stored_conversation_id(self, client, invoke_mock, httpx_mock: HTTPXMock):
         """send() uses stored conversation ID in subsequent calls."""
-        httpx_mock.add_response(
-            url="https://metadata.example.com/api/v1/agents/dynamic/name/TestAgent/invoke",
-            json={"conversationId": "conv-xyz", "response": "First", "toolsUsed": []},
-        )
-        httpx_mock.add_response(
-            url="https://metadata.example.com/api/v1/agents/dynamic/name/TestAgent/invoke",
-            json={"conversationId": "conv-xyz", "response": "Second", "toolsUsed": []},
-        )
+        invoke_mock("First", conversation_id="conv-xyz")
+        invoke_mock("Second", conversation_id="conv-xyz")
 
         conv = Conversation(client.agent("TestAgent"))
         conv.send("First")
@@ -66,12 +71,9 @@ class TestConversationSend:
         assert "conversationId" not in first_body
         assert second_body.get("conversationId") == "conv-xyz"
 
-    def test_send_with_parameters(self, client, httpx_mock: HTTPXMock):
+    def test_send_with_parameters(self, client, invoke_mock, httpx_mock: HTTPXMock):
         """send() passes parameters to agent."""
-        httpx_mock.add_response(
-            url="https://metadata.example.com/api/v1/agents/dynamic/name/TestAgent/invoke",
-            json={"conversationId": "conv-123", "response": "OK", "toolsUsed": []},
-        )
+        invoke_mock("OK")
 
         conv = Conversation(client.agent("TestAgent"))
         conv.send("Query", parameters={"key": "value"})
@@ -80,16 +82,9 @@ class TestConversationSend:
         body = json.loads(request.content)
         assert body.get("parameters") == {"key": "value"}
 
-    def test_send_without_message(self, client, httpx_mock: HTTPXMock):
+    def test_send_without_message(self, client, invoke_mock, httpx_mock: HTTPXMock):
         """send() works without providing a message (uses agent's default prompt)."""
-        httpx_mock.add_response(
-            url="https://metadata.example.com/api/v1/agents/dynamic/name/TestAgent/invoke",
-            json={
-                "conversationId": "conv-123",
-                "response": "Default task executed.",
-                "toolsUsed": [],
-            },
-        )
+        invoke_mock("Default task executed.")
 
         conv = Conversation(client.agent("TestAgent"))
         result = conv.send()
@@ -101,12 +96,9 @@ class TestConversationSend:
         body = json.loads(request.content)
         assert "message" not in body
 
-    def test_send_without_message_does_not_add_to_history(self, client, httpx_mock: HTTPXMock):
+    def test_send_without_message_does_not_add_to_history(self, client, invoke_mock):
         """send() without message does not add entry to history."""
-        httpx_mock.add_response(
-            url="https://metadata.example.com/api/v1/agents/dynamic/name/TestAgent/invoke",
-            json={"conversationId": "conv-123", "response": "OK", "toolsUsed": []},
-        )
+        invoke_mock("OK")
 
         conv = Conversation(client.agent("TestAgent"))
         conv.send()
@@ -118,16 +110,10 @@ class TestConversationSend:
 class TestConversationHistory:
     """Tests for Conversation history tracking."""
 
-    def test_history_records_exchanges(self, client, httpx_mock: HTTPXMock):
+    def test_history_records_exchanges(self, client, invoke_mock):
         """history records user and assistant message pairs."""
-        httpx_mock.add_response(
-            url="https://metadata.example.com/api/v1/agents/dynamic/name/TestAgent/invoke",
-            json={"conversationId": "conv-123", "response": "Response 1", "toolsUsed": []},
-        )
-        httpx_mock.add_response(
-            url="https://metadata.example.com/api/v1/agents/dynamic/name/TestAgent/invoke",
-            json={"conversationId": "conv-123", "response": "Response 2", "toolsUsed": []},
-        )
+        invoke_mock("Response 1")
+        invoke_mock("Response 2")
 
         conv = Conversation(client.agent("TestAgent"))
         conv.send("Message 1")
@@ -138,12 +124,9 @@ class TestConversationHistory:
             ("Message 2", "Response 2"),
         ]
 
-    def test_messages_in_chat_format(self, client, httpx_mock: HTTPXMock):
+    def test_messages_in_chat_format(self, client, invoke_mock):
         """messages returns chat format with roles."""
-        httpx_mock.add_response(
-            url="https://metadata.example.com/api/v1/agents/dynamic/name/TestAgent/invoke",
-            json={"conversationId": "conv-123", "response": "Hello there!", "toolsUsed": []},
-        )
+        invoke_mock("Hello there!")
 
         conv = Conversation(client.agent("TestAgent"))
         conv.send("Hello")
@@ -157,12 +140,9 @@ class TestConversationHistory:
 class TestConversationReset:
     """Tests for Conversation.reset()."""
 
-    def test_reset_clears_state(self, client, httpx_mock: HTTPXMock):
+    def test_reset_clears_state(self, client, invoke_mock):
         """reset() clears conversation ID and history."""
-        httpx_mock.add_response(
-            url="https://metadata.example.com/api/v1/agents/dynamic/name/TestAgent/invoke",
-            json={"conversationId": "conv-123", "response": "OK", "toolsUsed": []},
-        )
+        invoke_mock("OK")
 
         conv = Conversation(client.agent("TestAgent"))
         conv.send("Message")
@@ -180,12 +160,9 @@ class TestConversationAsync:
     """Tests for async Conversation methods."""
 
     @pytest.mark.asyncio
-    async def test_asend_returns_response_and_stores_id(self, httpx_mock: HTTPXMock):
+    async def test_asend_returns_response_and_stores_id(self, invoke_mock):
         """asend() returns response text and stores conversation ID."""
-        httpx_mock.add_response(
-            url="https://metadata.example.com/api/v1/agents/dynamic/name/TestAgent/invoke",
-            json={"conversationId": "async-conv-id", "response": "Async response", "toolsUsed": []},
-        )
+        invoke_mock("Async response", conversation_id="async-conv-id")
 
         client = AISdk(
             host="https://metadata.example.com",
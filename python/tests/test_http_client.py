@@ -1,5 +1,7 @@
 """Tests for the AI SDK HTTP client."""
 
+import logging
+
 import pytest
 from pytest_httpx import HTTPXMock
 
@@ -13,18 +15,25 @@ from ai_sdk.exceptions import (
     RateLimitError,
 )
 
+_BASE_URL = "https://api.example.com/v1/api/agents"
+_TEST_INVOKE_URL = f"{_BASE_URL}/test/invoke"
+
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def auth():
     """Token auth fixture."""
     return TokenAuth("test-jwt-token")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def http_client(auth):
-    """HTTP client fixture with retries disabled for predictable error testing."""
+    """HTTP client fixture with retries disabled for predictable error testing.
+
+    Shared by the module: pytest-httpx patches the transport and resets its
+    registered responses per test, so reusing the client is safe.
+    """
     client = HTTPClient(
-        base_url="https://api.example.com/v1/api/agents",
+        base_url=_BASE_URL,
         auth=auth,
         timeout=30.0,
         max_retries=0,
@@ -33,15 +42,19 @@ def http_client(auth):
     client.close()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def http_client_with_retries(auth):
-    """HTTP client fixture with retries enabled."""
+    """HTTP client fixture with retries enabled and no backoff sleep.
+
+    Retry behavior is asserted through the number of requests sent, so the
+    backoff delay is zero to keep the tests free of wall-clock waits.
+    """
     client = HTTPClient(
-        base_url="https://api.example.com/v1/api/agents",
+        base_url=_BASE_URL,
         auth=auth,
         timeout=30.0,
         max_retries=2,
-        retry_delay=0.01,
+        retry_delay=0.0,
     )
     yield client
     client.close()
@@ -53,7 +66,7 @@ class TestHTTPClientRequests:
     def test_get_returns_json(self, http_client, httpx_mock: HTTPXMock):
         """GET returns JSON response."""
         httpx_mock.add_response(
-            url="https://api.example.com/v1/api/agents/TestAgent",
+            url=f"{_BASE_URL}/TestAgent",
             json={"name": "TestAgent", "apiEnabled": True},
         )
 
@@ -63,7 +76,7 @@ class TestHTTPClientRequests:
 
     def test_get_sends_auth_header(self, http_client, httpx_mock: HTTPXMock):
         """GET includes Authorization header."""
-        httpx_mock.add_response(url="https://api.example.com/v1/api/agents/test", json={})
+        httpx_mock.add_response(url=f"{_BASE_URL}/test", json={})
 
         http_client.get("/test")
 
@@ -73,7 +86,7 @@ class TestHTTPClientRequests:
     def test_post_returns_json(self, http_client, httpx_mock: HTTPXMock):
         """POST returns JSON response."""
         httpx_mock.add_response(
-            url="https://api.example.com/v1/api/agents/TestAgent/invoke",
+            url=f"{_BASE_URL}/TestAgent/invoke",
             json={"conversationId": "conv-123", "response": "Hello!"},
         )
 
@@ -83,82 +96,79 @@ class TestHTTPClientRequests:
 
         assert result["response"] == "Hello!"
 
+    def test_post_absolute_url_logs_requested_url(self, http_client, httpx_mock: HTTPXMock, caplog):
+        """POST to an absolute URL logs that URL, not the base URL joined to it."""
+        httpx_mock.add_response(url="https://metadata.example.com/mcp", json={})
 
-class TestHTTPClientErrorHandling:
-    """Tests for HTTPClient error handling."""
-
-    def test_401_raises_authentication_error(self, http_client, httpx_mock: HTTPXMock):
-        """401 raises AuthenticationError."""
-        httpx_mock.add_response(
-            url="https://api.example.com/v1/api/agents/test/invoke",
-            status_code=401,
-        )
-
-        with pytest.raises(AuthenticationError):
-            http_client.post("/test/invoke", json={})
+        with caplog.at_level(logging.DEBUG, logger="ai_sdk"):
+            http_client.post("https://metadata.example.com/mcp", json={})
 
-    def test_403_with_agent_raises_not_enabled_error(self, http_client, httpx_mock: HTTPXMock):
-        """403 with agent_name raises AgentNotEnabledError."""
-        httpx_mock.add_response(
-            url="https://api.example.com/v1/api/agents/InternalAgent/invoke",
-            status_code=403,
-        )
-
-        with pytest.raises(AgentNotEnabledError) as exc_info:
-            http_client.post("/InternalAgent/invoke", json={}, agent_name="InternalAgent")
-
-        assert exc_info.value.agent_name == "InternalAgent"
-
-    def test_404_with_agent_raises_not_found_error(self, http_client, httpx_mock: HTTPXMock):
-        """404 with agent_name raises AgentNotFoundError."""
-        httpx_mock.add_response(
-            url="https://api.example.com/v1/api/agents/MissingAgent/invoke",
-            status_code=404,
-        )
-
-        with pytest.raises(AgentNotFoundError) as exc_info:
-            http_client.post("/MissingAgent/invoke", json={}, agent_name="MissingAgent")
-
-        assert exc_info.value.agent_name == "MissingAgent"
-
-    def test_429_raises_rate_limit_error_with_retry_after(self, http_client, httpx_mock: HTTPXMock):
-        """429 raises RateLimitError with retry_after from header."""
-        httpx_mock.add_response(
-            url="https://api.example.com/v1/api/agents/test/invoke",
-            status_code=429,
-            headers={"Retry-After": "60"},
-        )
+        assert "POST https://metadata.example.com/mcp" in caplog.text
+        assert _BASE_URL not in caplog.text
 
-        with pytest.raises(RateLimitError) as exc_info:
-            http_client.post("/test/invoke", json={})
 
-        assert exc_info.value.retry_after == 60
-
-    def test_500_raises_execution_error(self, http_client, httpx_mock: HTTPXMock):
-        """500 raises AgentExecutionError with message from response."""
-        httpx_mock.add_response(
-            url="https://api.example.com/v1/api/agents/test/invoke",
-            status_code=500,
-            json={"message": "Internal error"},
-        )
-
-        with pytest.raises(AgentExecutionError) as exc_info:
-            http_client.post("/test/invoke", json={})
-
-        assert "Internal error" in str(exc_info.value)
+class TestHTTPClientErrorHandling:
+    """Tests for HTTPClient error handling."""
 
-    def test_500_plain_text_error(self, http_client, httpx_mock: HTTPXMock):
-        """500 with non-JSON response includes response text."""
+    @pytest.mark.parametrize(
+        ("status_code", "agent_name", "response", "error_type", "attrs", "message"),
+        [
+            (401, None, {}, AuthenticationError, {}, None),
+            (403, "InternalAgent", {}, AgentNotEnabledError, {"agent_name": "InternalAgent"}, None),
+            (404, "MissingAgent", {}, AgentNotFoundError, {"agent_name": "MissingAgent"}, None),
+            (
+                429,
+                None,
+                {"headers": {"Retry-After": "60"}},
+                RateLimitError,
+                {"retry_after": 60},
+                None,
+            ),
+            (
+                500,
+                None,
+                {"json": {"message": "Internal error"}},
+                AgentExecutionError,
+                {},
+                "Internal error",
+            ),
+            (500, None, {"text": "Server Error"}, AgentExecutionError, {}, "Server Error"),
+        ],
+        ids=[
+            "401-authentication",
+            "403-agent-not-enabled",
+            "404-agent-not-found",
+            "429-rate-limit-retry-after",
+            "500-json-message",
+            "500-plain-text",
+        ],
+    )
+    def test_status_raises_mapped_error(
+        self,
+        http_client,
+        httpx_mock: HTTPXMock,
+        status_code,
+        agent_name,
+        response,
+        error_type,
+        attrs,
+        message,
+    ):
+        """Error statuses raise the matching SDK exception with its details."""
+        path = f"/{agent_name or 'test'}/invoke"
         httpx_mock.add_response(
-            url="https://api.example.com/v1/api/agents/test/invoke",
-            status_code=500,
-            text="Server Error",
+            url=f"{_BASE_URL}{path}",
+            status_code=status_code,
+            **response,
         )
 
-        with pytest.raises(AgentExecutionError) as exc_info:
-            http_client.post("/test/invoke", json={})
+        with pytest.raises(error_type) as exc_info:
+            http_client.post(path, json={}, agent_name=agent_name)
 
-        assert "Server Error" in str(exc_info.value)
+        for attr, expected in attrs.items():
+            assert getattr(exc_info.value, attr) == expected
+        if message is not None:
+            assert message in str(exc_info.value)
 
 
 class TestHTTPClientStreaming:
@@ -167,7 +177,7 @@ class TestHTTPClientStreaming:
     def test_post_stream_yields_chunks(self, http_client, httpx_mock: HTTPXMock):
         """post_stream yields response chunks with correct Accept header."""
         httpx_mock.add_response(
-            url="https://api.example.com/v1/api/agents/test/stream",
+            url=f"{_BASE_URL}/test/stream",
             content=b'event: message\ndata: {"content": "Hello"}\n\n',
         )
 
@@ -183,14 +193,8 @@ class TestHTTPClientRetry:
 
     def test_retries_on_transient_errors(self, http_client_with_retries, httpx_mock: HTTPXMock):
         """Retries on 429, 500, 502, 503, 504 and succeeds."""
-        httpx_mock.add_response(
-            url="https://api.example.com/v1/api/agents/test/invoke",
-            status_code=500,
-        )
-        httpx_mock.add_response(
-            url="https://api.example.com/v1/api/agents/test/invoke",
-            json={"response": "Success after retry"},
-        )
+        httpx_mock.add_response(url=_TEST_INVOKE_URL, status_code=500)
+        httpx_mock.add_response(url=_TEST_INVOKE_URL, json={"response": "Success after retry"})
 
         result = http_client_with_retries.post("/test/invoke", json={})
 
@@ -199,10 +203,7 @@ class TestHTTPClientRetry:
 
     def test_no_retry_on_client_errors(self, http_client_with_retries, httpx_mock: HTTPXMock):
         """Does not retry on 401, 403, 404 (client errors)."""
-        httpx_mock.add_response(
-            url="https://api.example.com/v1/api/agents/test/invoke",
-            status_code=401,
-        )
+        httpx_mock.add_response(url=_TEST_INVOKE_URL, status_code=401)
 
         with pytest.raises(AuthenticationError):
             http_client_with_retries.post("/test/invoke", json={})
@@ -211,12 +212,12 @@ class TestHTTPClientRetry:
 
     def test_exhausts_retries_then_raises(self, http_client_with_retries, httpx_mock: HTTPXMock):
         """Raises after exhausting all retries."""
-        for _ in range(3):
-            httpx_mock.add_response(
-                url="https://api.example.com/v1/api/agents/test/invoke",
-                status_code=500,
-                json={"message": "Persistent error"},
-            )
+        httpx_mock.add_response(
+            url=_TEST_INVOKE_URL,
+            status_code=500,
+            json={"message": "Persistent error"},
+            is_reusable=True,
+        )
 
         with pytest.raises(AgentExecutionError) as exc_info:
             http_client_with_retries.post("/test/invoke", json={})
@@ -226,7 +227,7 @@ class TestHTTPClientRetry:
 
     def test_includes_request_id_header(self, http_client_with_retries, httpx_mock: HTTPXMock):
         """Requests include X-Request-ID header for correlation."""
-        httpx_mock.add_response(url="https://api.example.com/v1/api/agents/test", json={})
+        httpx_mock.add_response(url=f"{_BASE_URL}/test", json={})
 
         http_client_with_retries.get("/test")
 
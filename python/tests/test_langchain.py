@@ -1,12 +1,16 @@
 """Tests for the AI SDK LangChain integration."""
 
 import json
+from unittest.mock import patch
 
 import pytest
 from pytest_httpx import HTTPXMock
 
-from ai_sdk.client import AISdk
+from ai_sdk.agent import AgentHandle
+from ai_sdk.models import AgentInfo
 
+# conftest skips collecting this module without the langchain extra; this also
+# covers running the file directly, which bypasses collect_ignore_glob.
 pytest.importorskip("langchain_core")
 
 from ai_sdk.integrations.langchain import (
@@ -14,17 +18,13 @@ from ai_sdk.integrations.langchain import (
     create_ai_sdk_tools,
 )
 
-
-@pytest.fixture
-def client():
-    """AISdk client fixture with retries disabled for testing."""
-    c = AISdk(
-        host="https://metadata.example.com",
-        token="test-jwt-token",
-        max_retries=0,
-    )
-    yield c
-    c.close()
+_DATA_QUALITY_AGENT_INFO = {
+    "name": "DataQualityAgent",
+    "displayName": "Data Quality Agent",
+    "description": "Analyzes data quality issues in tables",
+    "abilities": ["search_metadata", "analyze_quality"],
+    "apiEnabled": True,
+}
 
 
 @pytest.fixture
@@ -32,16 +32,29 @@ def mock_agent_info(httpx_mock: HTTPXMock):
     """Mock agent info endpoint."""
     httpx_mock.add_response(
         url="https://metadata.example.com/api/v1/agents/dynamic/name/DataQualityAgent",
-        json={
-            "name": "DataQualityAgent",
-            "displayName": "Data Quality Agent",
-            "description": "Analyzes data quality issues in tables",
-            "abilities": ["search_metadata", "analyze_quality"],
-            "apiEnabled": True,
-        },
+        json=_DATA_QUALITY_AGENT_INFO,
     )
 
 
+@pytest.fixture(scope="module")
+def _dq_tool(no_retry_client):
+    """DataQualityAgent tool, built once per module.
+
+    Agent info is stubbed on the handle so building the tool sends no request;
+    the from_client tests still build their own tools against mocked info.
+    """
+    info = AgentInfo.from_dict(_DATA_QUALITY_AGENT_INFO)
+    with patch.object(AgentHandle, "get_info", return_value=info):
+        return AISdkAgentTool.from_client(no_retry_client, "DataQualityAgent")
+
+
+@pytest.fixture
+def dq_tool(_dq_tool):
+    """Shared DataQualityAgent tool with its conversation reset for each test."""
+    _dq_tool.reset_conversation()
+    return _dq_tool
+
+
 @pytest.fixture
 def mock_agent_invoke(httpx_mock: HTTPXMock):
     """Mock agent invoke endpoint."""
@@ -58,19 +71,21 @@ def mock_agent_invoke(httpx_mock: HTTPXMock):
 class TestAISdkAgentToolInit:
     """Tests for AISdkAgentTool initialization."""
 
-    def test_from_client_creates_tool_with_auto_description(self, client, mock_agent_info):
+    def test_from_client_creates_tool_with_auto_description(self, no_retry_client, mock_agent_info):
         """from_client creates tool with name and auto-generated description."""
-        tool = AISdkAgentTool.from_client(client, "DataQualityAgent")
+        tool = AISdkAgentTool.from_client(no_retry_client, "DataQualityAgent")
 
         assert tool.name == "metadata_DataQualityAgent"
         assert "data quality" in tool.description.lower()
         assert "search_metadata" in tool.description
         assert "analyze_quality" in tool.description
 
-    def test_from_client_accepts_custom_name_and_description(self, client, mock_agent_info):
+    def test_from_client_accepts_custom_name_and_description(
+        self, no_retry_client, mock_agent_info
+    ):
         """from_client accepts custom name and description."""
         tool = AISdkAgentTool.from_client(
-            client,
+            no_retry_client,
             "DataQualityAgent",
             name="my_custom_tool",
             description="My custom description",
@@ -79,14 +94,14 @@ class TestAISdkAgentToolInit:
         assert tool.name == "my_custom_tool"
         assert tool.description == "My custom description"
 
-    def test_fallback_when_get_info_fails(self, client, httpx_mock: HTTPXMock):
+    def test_fallback_when_get_info_fails(self, no_retry_client, httpx_mock: HTTPXMock):
         """Tool uses fallback when get_info fails."""
         httpx_mock.add_response(
             url="https://metadata.example.com/api/v1/agents/dynamic/name/UnknownAgent",
             status_code=500,
         )
 
-        tool = AISdkAgentTool.from_client(client, "UnknownAgent")
+        tool = AISdkAgentTool.from_client(no_retry_client, "UnknownAgent")
 
         assert tool.name == "metadata_UnknownAgent"
         assert "UnknownAgent" in tool.description
@@ -95,17 +110,13 @@ class TestAISdkAgentToolInit:
 class TestAISdkAgentToolRun:
     """Tests for AISdkAgentTool._run() method."""
 
-    def test_run_invokes_agent_and_returns_response(
-        self, client, mock_agent_info, mock_agent_invoke
-    ):
+    def test_run_invokes_agent_and_returns_response(self, dq_tool, mock_agent_invoke):
         """_run invokes agent and returns response text."""
-        tool = AISdkAgentTool.from_client(client, "DataQualityAgent")
-
-        result = tool._run("Check data quality of customers table")
+        result = dq_tool._run("Check data quality of customers table")
 
         assert "3 data quality issues" in result
 
-    def test_run_preserves_conversation_id(self, client, mock_agent_info, httpx_mock):
+    def test_run_preserves_conversation_id(self, dq_tool, httpx_mock):
         """_run stores and uses conversation_id for multi-turn."""
         httpx_mock.add_response(
             url="https://metadata.example.com/api/v1/agents/dynamic/name/DataQualityAgent/invoke",
@@ -116,40 +127,36 @@ class TestAISdkAgentToolRun:
             json={"conversationId": "conv-first", "response": "Second response"},
         )
 
-        tool = AISdkAgentTool.from_client(client, "DataQualityAgent")
-        tool._run("First query")
-        tool._run("Second query")
+        dq_tool._run("First query")
+        assert dq_tool._conversation_id == "conv-first"
+        dq_tool._run("Second query")
 
-        requests = [r for r in httpx_mock.get_requests() if "/invoke" in str(r.url)]
-        first_body = json.loads(requests[0].content)
-        second_body = json.loads(requests[1].content)
+        # dq_tool is built without an info lookup, so only the two invokes were sent.
+        first_body, second_body = (json.loads(r.content) for r in httpx_mock.get_requests())
 
         assert "conversationId" not in first_body
         assert second_body["conversationId"] == "conv-first"
 
-    def test_reset_conversation_clears_id(self, client, mock_agent_info, httpx_mock):
+    def test_reset_conversation_clears_id(self, dq_tool, httpx_mock):
         """reset_conversation clears stored conversation_id."""
         httpx_mock.add_response(
             url="https://metadata.example.com/api/v1/agents/dynamic/name/DataQualityAgent/invoke",
             json={"conversationId": "conv-to-reset", "response": "OK"},
         )
 
-        tool = AISdkAgentTool.from_client(client, "DataQualityAgent")
-        tool._run("Query")
-        assert tool._conversation_id == "conv-to-reset"
+        dq_tool._run("Query")
+        assert dq_tool._conversation_id == "conv-to-reset"
 
-        tool.reset_conversation()
-        assert tool._conversation_id is None
+        dq_tool.reset_conversation()
+        assert dq_tool._conversation_id is None
 
 
 class TestAISdkAgentToolLangChainInterface:
     """Tests for LangChain BaseTool interface compliance."""
 
-    def test_invoke_method_works(self, client, mock_agent_info, mock_agent_invoke):
+    def test_invoke_method_works(self, dq_tool, mock_agent_invoke):
         """Tool works with LangChain invoke() method."""
-        tool = AISdkAgentTool.from_client(client, "DataQualityAgent")
-
-        result = tool.invoke({"query": "Test query"})
+        result = dq_tool.invoke({"query": "Test query"})
 
         assert isinstance(result, str)
         assert "data quality" in result.lower()
@@ -158,7 +165,7 @@ class TestAISdkAgentToolLangChainInterface:
 class TestCreateAISdkTools:
     """Tests for create_ai_sdk_tools helper function."""
 
-    def test_creates_tools_for_specific_agents(self, client, httpx_mock: HTTPXMock):
+    def test_creates_tools_for_specific_agents(self, no_retry_client, httpx_mock: HTTPXMock):
         """create_ai_sdk_tools creates tools for specified agent names."""
         httpx_mock.add_response(
             url="https://metadata.example.com/api/v1/agents/dynamic/name/Agent1",
@@ -181,13 +188,15 @@ class TestCreateAISdkTools:
             },
         )
 
-        tools = create_ai_sdk_tools(client, agent_names=["Agent1", "Agent2"])
+        tools = create_ai_sdk_tools(no_retry_client, agent_names=["Agent1", "Agent2"])
 
         assert len(tools) == 2
         assert tools[0].name == "metadata_Agent1"
         assert tools[1].name == "metadata_Agent2"
 
-    def test_creates_tools_for_api_enabled_agents_only(self, client, httpx_mock: HTTPXMock):
+    def test_creates_tools_for_api_enabled_agents_only(
+        self, no_retry_client, httpx_mock: HTTPXMock
+    ):
         """create_ai_sdk_tools with None fetches only API-enabled agents."""
         httpx_mock.add_response(
             url="https://metadata.example.com/api/v1/agents/dynamic/?apiEnabled=true&limit=100",
@@ -209,7 +218,7 @@ class TestCreateAISdkTools:
             },
         )
 
-        tools = create_ai_sdk_tools(client)
+        tools = create_ai_sdk_tools(no_retry_client)
 
         assert len(tools) == 1
         assert tools[0].name == "metadata_EnabledAgent"
@@ -1,68 +1,142 @@
 """Tests for MCP client."""
 
+import json
+from itertools import cycle, islice
+
 import pytest
 from pytest_httpx import HTTPXMock
 
-from ai_sdk.client import AISdk
 from ai_sdk.exceptions import MCPError, MCPToolExecutionError
-from ai_sdk.mcp._client import MCPClient
+from ai_sdk.mcp._client import MCPClient, _filter_tools
 from ai_sdk.mcp.models import MCPTool, ToolInfo
+from tests.mcp_helpers import CUSTOMERS_RESULT_BODY, MCP_URL, rpc_error, rpc_result
+
+_SEARCH_METADATA_TOOL = {
+    "name": "search_metadata",
+    "description": "Search for metadata",
+    "inputSchema": {
+        "type": "object",
+        "properties": {
+            "query": {"type": "string", "description": "Search query"},
+        },
+        "required": ["query"],
+    },
+}
+
+# Shared envelopes, encoded once at import rather than per test.
+_EMPTY_TOOLS = rpc_result({"tools": []})
+_SEARCH_METADATA_TOOLS = rpc_result({"tools": [_SEARCH_METADATA_TOOL]})
+
+
+_NEW_TOOL_CASES = [
+    pytest.param(
+        MCPTool.SEMANTIC_SEARCH,
+        {"query": "revenue metrics", "size": 5},
+        {
+            "query": "revenue metrics",
+            "results": [{"name": "monthly_revenue"}],
+            "totalFound": 1,
+        },
+        id="semantic_search",
+    ),
+    pytest.param(
+        MCPTool.GET_TEST_DEFINITIONS,
+        {"entityType": "COLUMN", "testPlatform": "OpenMetadata"},
+        {"data": [{"name": "columnValuesToBeNotNull"}], "paging": {}},
+        id="get_test_definitions",
+    ),
+    pytest.param(
+        MCPTool.CREATE_TEST_CASE,
+        {
+            "name": "test_not_null_email",
+            "fqn": "db.schema.users",
+            "columnName": "email",
+            "testDefinitionName": "columnValuesToBeNotNull",
+            "parameterValues": [],
+        },
+        {"id": "abc-123", "name": "test_not_null_email"},
+        id="create_test_case",
+    ),
+    pytest.param(
+        MCPTool.ROOT_CAUSE_ANALYSIS,
+        {
+            "fqn": "db.schema.orders",
+            "entityType": "table",
+            "upstreamDepth": 3,
+            "downstreamDepth": 3,
+        },
+        {"fqn": "db.schema.orders", "status": "failed", "summary": "Upstream failure detected"},
+        id="root_cause_analysis",
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def mcp(no_retry_client):
+    """MCPClient over the session client's HTTP stack, built once per module."""
+    return MCPClient(no_retry_client._host, no_retry_client._auth, no_retry_client._http)
 
 
 @pytest.fixture
-def client():
-    """AISdk client fixture."""
-    c = AISdk(
-        host="https://metadata.example.com",
-        token="test-token",
-        max_retries=0,
-    )
-    yield c
-    c.close()
+def mcp_replying(mcp, httpx_mock: HTTPXMock):
+    """Return the shared MCPClient after mocking the /mcp endpoint to answer with ``body``.
+
+    For tests that only check how a single response is parsed.
+    """
+
+    def make(body: bytes) -> MCPClient:
+        httpx_mock.add_response(url=MCP_URL, method="POST", content=body)
+        return mcp
+
+    return make
 
 
 class TestMCPClientInit:
     """Tests for MCPClient initialization."""
 
-    def test_mcp_client_created_from_metadata_client(self, client):
+    def test_mcp_client_created_from_metadata_client(self, fresh_client):
         """MCPClient can be created from AISdk client."""
-        mcp = MCPClient(client._host, client._auth, client._http)
+        mcp = MCPClient(fresh_client._host, fresh_client._auth, fresh_client._http)
         assert mcp is not None
 
+    def test_mcp_client_reuses_parent_http_client(self, fresh_client, mcp, httpx_mock: HTTPXMock):
+        """MCPClient posts to {host}/mcp through the parent HTTPClient."""
+        httpx_mock.add_response(
+            url=MCP_URL,
+            method="POST",
+            content=_EMPTY_TOOLS,
+        )
+
+        mcp.list_tools()
 
-class TestMCPClientListTools:
-    """Tests for MCPClient.list_tools()."""
+        assert mcp._http is fresh_client._http
+        request = httpx_mock.get_request()
+        assert request.headers["Accept"] == "application/json, text/event-stream"
 
-    def test_list_tools_returns_tool_info_list(self, client, httpx_mock: HTTPXMock):
-        """list_tools returns list of ToolInfo."""
+    def test_jsonrpc_ids_are_sequential(self, fresh_client, httpx_mock: HTTPXMock):
+        """Each JSON-RPC request gets the next integer id."""
         httpx_mock.add_response(
-            url="https://metadata.example.com/mcp",
+            url=MCP_URL,
             method="POST",
-            json={
-                "jsonrpc": "2.0",
-                "id": "test-id",
-                "result": {
-                    "tools": [
-                        {
-                            "name": "search_metadata",
-                            "description": "Search for metadata",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "query": {
-                                        "type": "string",
-                                        "description": "Search query",
-                                    },
-                                },
-                                "required": ["query"],
-                            },
-                        },
-                    ]
-                },
-            },
+            content=_EMPTY_TOOLS,
+            is_reusable=True,
         )
 
-        mcp = MCPClient(client._host, client._auth, client._http)
+        mcp = MCPClient(fresh_client._host, fresh_client._auth, fresh_client._http)
+        mcp.list_tools()
+        mcp.list_tools()
+
+        ids = [json.loads(r.content)["id"] for r in httpx_mock.get_requests()]
+        assert ids == [1, 2]
+
+
+class TestMCPClientListTools:
+    """Tests for MCPClient.list_tools()."""
+
+    def test_list_tools_returns_tool_info_list(self, mcp_replying):
+        """list_tools returns list of ToolInfo."""
+        mcp = mcp_replying(_SEARCH_METADATA_TOOLS)
+
         tools = mcp.list_tools()
 
         assert len(tools) == 1
@@ -72,30 +146,13 @@ class TestMCPClientListTools:
         assert tools[0].parameters[0].name == "query"
         assert tools[0].parameters[0].required is True
 
-    def test_list_tools_skips_unknown_tools(self, client, httpx_mock: HTTPXMock):
+    def test_list_tools_skips_unknown_tools(self, mcp_replying):
         """list_tools gracefully skips tools not in MCPTool enum."""
-        httpx_mock.add_response(
-            url="https://metadata.example.com/mcp",
-            method="POST",
-            json={
-                "jsonrpc": "2.0",
-                "id": "test-id",
-                "result": {
+        mcp = mcp_replying(
+            rpc_result(
+                {
                     "tools": [
-                        {
-                            "name": "search_metadata",
-                            "description": "Search for metadata",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "query": {
-                                        "type": "string",
-                                        "description": "Search query",
-                                    },
-                                },
-                                "required": ["query"],
-                            },
-                        },
+                        _SEARCH_METADATA_TOOL,
                         {
                             "name": "some_future_tool",
                             "description": "A tool the SDK does not know about yet",
@@ -105,11 +162,10 @@ class TestMCPClientListTools:
                             },
                         },
                     ]
-                },
-            },
+                }
+            )
         )
 
-        mcp = MCPClient(client._host, client._auth, client._http)
         tools = mcp.list_tools()
 
         assert len(tools) == 1
@@ -119,220 +175,99 @@ class TestMCPClientListTools:
 class TestMCPClientCallTool:
     """Tests for MCPClient.call_tool()."""
 
-    def test_call_tool_returns_result(self, client, httpx_mock: HTTPXMock):
+    def test_call_tool_returns_result(self, mcp_replying):
         """call_tool returns ToolCallResult on success."""
-        httpx_mock.add_response(
-            url="https://metadata.example.com/mcp",
-            method="POST",
-            json={
-                "jsonrpc": "2.0",
-                "id": "test-id",
-                "result": {"content": [{"type": "text", "text": '{"tables": ["customers"]}'}]},
-            },
-        )
+        mcp = mcp_replying(CUSTOMERS_RESULT_BODY)
 
-        mcp = MCPClient(client._host, client._auth, client._http)
         result = mcp.call_tool(MCPTool.SEARCH_METADATA, {"query": "customer"})
 
         assert result.success is True
         assert result.data is not None
         assert result.error is None
 
-    def test_call_tool_raises_on_is_error(self, client, httpx_mock: HTTPXMock):
-        """call_tool raises MCPToolExecutionError when server sets isError."""
+    def test_call_tool_accepts_string_name(self, mcp, httpx_mock: HTTPXMock):
+        """call_tool accepts the tool's string value as well as the enum."""
         httpx_mock.add_response(
-            url="https://metadata.example.com/mcp",
+            url=MCP_URL,
             method="POST",
-            json={
-                "jsonrpc": "2.0",
-                "id": "test-id",
-                "result": {
-                    "content": [{"type": "text", "text": 'argument "content" is null'}],
-                    "isError": True,
-                },
-            },
+            content=CUSTOMERS_RESULT_BODY,
         )
 
-        mcp = MCPClient(client._host, client._auth, client._http)
+        result = mcp.call_tool("search_metadata", {"query": "customer"})
+
+        assert result.data == {"tables": ["customers"]}
+        body = json.loads(httpx_mock.get_request().content)
+        assert body["params"]["name"] == "search_metadata"
+
+    @pytest.mark.parametrize(
+        ("body", "error_type", "message", "tool"),
+        [
+            pytest.param(
+                rpc_result(
+                    {
+                        "content": [{"type": "text", "text": 'argument "content" is null'}],
+                        "isError": True,
+                    }
+                ),
+                MCPToolExecutionError,
+                'argument "content" is null',
+                "search_metadata",
+                id="is_error",
+            ),
+            pytest.param(
+                rpc_error({"code": -32000, "message": "Tool execution failed"}),
+                MCPError,
+                "Tool execution failed",
+                None,
+                id="jsonrpc_error",
+            ),
+        ],
+    )
+    def test_call_tool_raises_on_error(self, mcp_replying, body, error_type, message, tool):
+        """call_tool raises on isError results and on JSON-RPC errors."""
+        mcp = mcp_replying(body)
 
-        with pytest.raises(MCPToolExecutionError) as exc_info:
+        with pytest.raises(error_type) as exc_info:
             mcp.call_tool(MCPTool.SEARCH_METADATA, {"query": "customer"})
 
-        assert exc_info.value.tool == "search_metadata"
-        assert 'argument "content" is null' in str(exc_info.value)
-
-    def test_call_tool_handles_error(self, client, httpx_mock: HTTPXMock):
-        """call_tool raises MCPError on failure."""
-        httpx_mock.add_response(
-            url="https://metadata.example.com/mcp",
-            method="POST",
-            json={
-                "jsonrpc": "2.0",
-                "id": "test-id",
-                "error": {
-                    "code": -32000,
-                    "message": "Tool execution failed",
-                },
-            },
-        )
-
-        mcp = MCPClient(client._host, client._auth, client._http)
-
-        with pytest.raises(MCPError) as exc_info:
-            mcp.call_tool(MCPTool.SEARCH_METADATA, {"query": "test"})
-
-        assert "Tool execution failed" in str(exc_info.value)
+        assert type(exc_info.value) is error_type
+        assert message in str(exc_info.value)
+        assert getattr(exc_info.value, "tool", None) == tool
 
 
 class TestAISdkMCPProperty:
     """Tests for AISdk.mcp property."""
 
-    def test_mcp_property_returns_mcp_client(self, client):
+    def test_mcp_property_returns_mcp_client(self, fresh_client):
         """AISdk.mcp returns MCPClient instance."""
-        mcp = client.mcp
+        mcp = fresh_client.mcp
         assert isinstance(mcp, MCPClient)
 
-    def test_mcp_property_is_cached(self, client):
+    def test_mcp_property_is_cached(self, fresh_client):
         """AISdk.mcp returns same instance on repeated access."""
-        mcp1 = client.mcp
-        mcp2 = client.mcp
+        mcp1 = fresh_client.mcp
+        mcp2 = fresh_client.mcp
         assert mcp1 is mcp2
 
 
 class TestMCPClientCallNewTools:
     """Tests for calling the newer MCP tools."""
 
-    def test_call_semantic_search(self, client, httpx_mock: HTTPXMock):
-        """call_tool works with semantic_search tool."""
-        httpx_mock.add_response(
-            url="https://metadata.example.com/mcp",
-            method="POST",
-            json={
-                "jsonrpc": "2.0",
-                "id": "test-id",
-                "result": {
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": '{"query": "revenue metrics", "results": [{"name": "monthly_revenue"}], "totalFound": 1}',
-                        }
-                    ]
-                },
-            },
-        )
-
-        mcp = MCPClient(client._host, client._auth, client._http)
-        result = mcp.call_tool(MCPTool.SEMANTIC_SEARCH, {"query": "revenue metrics", "size": 5})
-
-        assert result.success is True
-        assert result.data["totalFound"] == 1
-        assert result.data["results"][0]["name"] == "monthly_revenue"
-
-    def test_call_get_test_definitions(self, client, httpx_mock: HTTPXMock):
-        """call_tool works with get_test_definitions tool."""
-        httpx_mock.add_response(
-            url="https://metadata.example.com/mcp",
-            method="POST",
-            json={
-                "jsonrpc": "2.0",
-                "id": "test-id",
-                "result": {
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": '{"data": [{"name": "columnValuesToBeNotNull"}], "paging": {}}',
-                        }
-                    ]
-                },
-            },
-        )
-
-        mcp = MCPClient(client._host, client._auth, client._http)
-        result = mcp.call_tool(
-            MCPTool.GET_TEST_DEFINITIONS,
-            {"entityType": "COLUMN", "testPlatform": "OpenMetadata"},
-        )
-
-        assert result.success is True
-        assert result.data["data"][0]["name"] == "columnValuesToBeNotNull"
-
-    def test_call_create_test_case(self, client, httpx_mock: HTTPXMock):
-        """call_tool works with create_test_case tool."""
-        httpx_mock.add_response(
-            url="https://metadata.example.com/mcp",
-            method="POST",
-            json={
-                "jsonrpc": "2.0",
-                "id": "test-id",
-                "result": {
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": '{"id": "abc-123", "name": "test_not_null_email"}',
-                        }
-                    ]
-                },
-            },
-        )
-
-        mcp = MCPClient(client._host, client._auth, client._http)
-        result = mcp.call_tool(
-            MCPTool.CREATE_TEST_CASE,
-            {
-                "name": "test_not_null_email",
-                "fqn": "db.schema.users",
-                "columnName": "email",
-                "testDefinitionName": "columnValuesToBeNotNull",
-                "parameterValues": [],
-            },
-        )
-
-        assert result.success is True
-        assert result.data["name"] == "test_not_null_email"
-
-    def test_call_root_cause_analysis(self, client, httpx_mock: HTTPXMock):
-        """call_tool works with root_cause_analysis tool."""
-        httpx_mock.add_response(
-            url="https://metadata.example.com/mcp",
-            method="POST",
-            json={
-                "jsonrpc": "2.0",
-                "id": "test-id",
-                "result": {
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": '{"fqn": "db.schema.orders", "status": "failed", "summary": "Upstream failure detected"}',
-                        }
-                    ]
-                },
-            },
-        )
+    @pytest.mark.parametrize(("tool", "arguments", "payload"), _NEW_TOOL_CASES)
+    def test_call_new_tool(self, mcp_replying, tool, arguments, payload):
+        """call_tool parses the text payload returned by each newer tool."""
+        mcp = mcp_replying(rpc_result({"content": [{"type": "text", "text": json.dumps(payload)}]}))
 
-        mcp = MCPClient(client._host, client._auth, client._http)
-        result = mcp.call_tool(
-            MCPTool.ROOT_CAUSE_ANALYSIS,
-            {
-                "fqn": "db.schema.orders",
-                "entityType": "table",
-                "upstreamDepth": 3,
-                "downstreamDepth": 3,
-            },
-        )
+        result = mcp.call_tool(tool, arguments)
 
         assert result.success is True
-        assert result.data["status"] == "failed"
-        assert "Upstream failure" in result.data["summary"]
+        assert result.data == payload
 
-    def test_list_tools_includes_new_tools(self, client, httpx_mock: HTTPXMock):
+    def test_list_tools_includes_new_tools(self, mcp_replying):
         """list_tools recognizes the new tool types."""
-        httpx_mock.add_response(
-            url="https://metadata.example.com/mcp",
-            method="POST",
-            json={
-                "jsonrpc": "2.0",
-                "id": "test-id",
-                "result": {
+        mcp = mcp_replying(
+            rpc_result(
+                {
                     "tools": [
                         {
                             "name": "semantic_search",
@@ -384,11 +319,10 @@ class TestMCPClientCallNewTools:
                             },
                         },
                     ]
-                },
-            },
+                }
+            )
         )
 
-        mcp = MCPClient(client._host, client._auth, client._http)
         tools = mcp.list_tools()
 
         assert len(tools) == 4
@@ -399,61 +333,60 @@ class TestMCPClientCallNewTools:
         assert MCPTool.ROOT_CAUSE_ANALYSIS in tool_names
 
 
+# _filter_tools only reads these, so the filter tests can share the instances.
+_SAMPLE_TOOLS = (
+    ToolInfo(name=MCPTool.SEARCH_METADATA, description="Search", parameters=[]),
+    ToolInfo(name=MCPTool.GET_ENTITY_DETAILS, description="Get entity", parameters=[]),
+    ToolInfo(name=MCPTool.PATCH_ENTITY, description="Patch entity", parameters=[]),
+)
+
+
+@pytest.fixture(scope="module")
+def sample_tools():
+    """Sample ToolInfo tuple, shared by the module."""
+    return _SAMPLE_TOOLS
+
+
 class TestMCPClientFiltering:
     """Tests for tool filtering."""
 
-    @pytest.fixture
-    def sample_tools(self):
-        """Sample ToolInfo list."""
-        return [
-            ToolInfo(
-                name=MCPTool.SEARCH_METADATA,
-                description="Search",
-                parameters=[],
+    @pytest.mark.parametrize(
+        ("include", "exclude", "expected"),
+        [
+            pytest.param([MCPTool.SEARCH_METADATA], None, [MCPTool.SEARCH_METADATA], id="include"),
+            pytest.param(
+                None,
+                [MCPTool.PATCH_ENTITY],
+                [MCPTool.SEARCH_METADATA, MCPTool.GET_ENTITY_DETAILS],
+                id="exclude",
             ),
-            ToolInfo(
-                name=MCPTool.GET_ENTITY_DETAILS,
-                description="Get entity",
-                parameters=[],
+            pytest.param(
+                None,
+                None,
+                [MCPTool.SEARCH_METADATA, MCPTool.GET_ENTITY_DETAILS, MCPTool.PATCH_ENTITY],
+                id="none_returns_all",
             ),
-            ToolInfo(
-                name=MCPTool.PATCH_ENTITY,
-                description="Patch entity",
-                parameters=[],
-            ),
-        ]
-
-    def test_filter_tools_include(self, sample_tools):
-        """filter_tools with include returns only specified tools."""
-        from ai_sdk.mcp._client import _filter_tools
-
-        filtered = _filter_tools(
-            sample_tools,
-            include=[MCPTool.SEARCH_METADATA],
-            exclude=None,
-        )
+        ],
+    )
+    def test_filter_tools(self, sample_tools, include, exclude, expected):
+        """filter_tools keeps included tools and drops excluded ones."""
+        filtered = _filter_tools(sample_tools, include=include, exclude=exclude)
 
-        assert len(filtered) == 1
-        assert filtered[0].name == MCPTool.SEARCH_METADATA
+        assert [t.name for t in filtered] == expected
 
-    def test_filter_tools_exclude(self, sample_tools):
-        """filter_tools with exclude removes specified tools."""
-        from ai_sdk.mcp._client import _filter_tools
+    def test_filter_tools_large_lists(self):
+        """filter_tools applies include and exclude together across many tools."""
+        tools = [
+            ToolInfo(name=name, description="", parameters=[])
+            for name in islice(cycle(MCPTool), 100)
+        ]
 
         filtered = _filter_tools(
-            sample_tools,
-            include=None,
-            exclude=[MCPTool.PATCH_ENTITY],
+            tools,
+            include=list(MCPTool),
+            exclude=[MCPTool.SEARCH_METADATA, MCPTool.PATCH_ENTITY],
         )
 
-        assert len(filtered) == 2
-        tool_names = [t.name for t in filtered]
-        assert MCPTool.PATCH_ENTITY not in tool_names
-
-    def test_filter_tools_none_returns_all(self, sample_tools):
-        """filter_tools with no filters returns all tools."""
-        from ai_sdk.mcp._client import _filter_tools
-
-        filtered = _filter_tools(sample_tools, include=None, exclude=None)
-
-        assert len(filtered) == 3
+        dropped = {MCPTool.SEARCH_METADATA, MCPTool.PATCH_ENTITY}
+        assert filtered == [t for t in tools if t.name not in dropped]
+        assert len(filtered) < len(tools)
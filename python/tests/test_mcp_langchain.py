@@ -3,118 +3,82 @@
 import pytest
 from pytest_httpx import HTTPXMock
 
+from ai_sdk.mcp.models import MCPTool
+from tests.mcp_helpers import (
+    CUSTOMERS_RESULT_BODY,
+    JSON_HEADERS,
+    MCP_URL,
+    SEARCH_AND_PATCH_BODY,
+    rpc_result,
+    sent_rpc_call,
+)
+
+# conftest skips collecting this module without the langchain extra; this also
+# covers running the file directly, which bypasses collect_ignore_glob.
 pytest.importorskip("langchain_core")
 
-from ai_sdk.client import AISdk
-from ai_sdk.mcp.models import MCPTool
+from langchain_core.tools import BaseTool
 
 
-@pytest.fixture
-def client():
-    """AISdk client fixture."""
-    c = AISdk(
-        host="https://metadata.example.com",
-        token="test-token",
-        max_retries=0,
-    )
-    yield c
-    c.close()
+def _queue(httpx_mock: HTTPXMock, *bodies: bytes) -> None:
+    """Register ``bodies`` as consecutive /mcp responses."""
+    for body in bodies:
+        httpx_mock.add_response(url=MCP_URL, method="POST", content=body, headers=JSON_HEADERS)
+
+
+# Envelopes shared across tests, encoded once at import.
+_TOOLS_LIST_BODY = rpc_result(
+    {
+        "tools": [
+            {
+                "name": "search_metadata",
+                "description": "Search for metadata",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "query": {"type": "string", "description": "Search query"},
+                    },
+                    "required": ["query"],
+                },
+            },
+        ]
+    }
+)
 
 
 @pytest.fixture
 def mock_list_tools(httpx_mock: HTTPXMock):
     """Mock list_tools response."""
-    httpx_mock.add_response(
-        url="https://metadata.example.com/mcp",
-        method="POST",
-        json={
-            "jsonrpc": "2.0",
-            "id": "test",
-            "result": {
-                "tools": [
-                    {
-                        "name": "search_metadata",
-                        "description": "Search for metadata",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "query": {"type": "string", "description": "Search query"},
-                            },
-                            "required": ["query"],
-                        },
-                    },
-                ]
-            },
-        },
-    )
+    _queue(httpx_mock, _TOOLS_LIST_BODY)
 
 
 class TestAsLangChainTools:
     """Tests for MCPClient.as_langchain_tools()."""
 
-    def test_returns_langchain_base_tools(self, client, mock_list_tools):
+    def test_returns_langchain_base_tools(self, fresh_client, mock_list_tools):
         """as_langchain_tools returns list of BaseTool instances."""
-        from langchain_core.tools import BaseTool
-
-        tools = client.mcp.as_langchain_tools()
+        tools = fresh_client.mcp.as_langchain_tools()
 
         assert len(tools) == 1
         assert isinstance(tools[0], BaseTool)
         assert tools[0].name == "search_metadata"
         assert "Search for metadata" in tools[0].description
 
-    def test_tool_invocation_calls_mcp(self, client, httpx_mock: HTTPXMock):
+    def test_tool_invocation_calls_mcp(self, fresh_client, httpx_mock: HTTPXMock):
         """LangChain tool invocation calls MCP server."""
-        # Mock list_tools
-        httpx_mock.add_response(
-            url="https://metadata.example.com/mcp",
-            method="POST",
-            json={
-                "jsonrpc": "2.0",
-                "id": "test",
-                "result": {
-                    "tools": [
-                        {
-                            "name": "search_metadata",
-                            "description": "Search",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "query": {"type": "string", "description": "Query"},
-                                },
-                                "required": ["query"],
-                            },
-                        },
-                    ]
-                },
-            },
-        )
-        # Mock tool call
-        httpx_mock.add_response(
-            url="https://metadata.example.com/mcp",
-            method="POST",
-            json={
-                "jsonrpc": "2.0",
-                "id": "test",
-                "result": {"content": [{"type": "text", "text": '{"tables": ["customers"]}'}]},
-            },
-        )
+        _queue(httpx_mock, _TOOLS_LIST_BODY, CUSTOMERS_RESULT_BODY)
 
-        tools = client.mcp.as_langchain_tools()
+        tools = fresh_client.mcp.as_langchain_tools()
         result = tools[0].invoke({"query": "customer"})
 
         assert "customers" in result
 
-    def test_tool_invocation_strips_none_arguments(self, client, httpx_mock: HTTPXMock):
+    def test_tool_invocation_strips_none_arguments(self, fresh_client, httpx_mock: HTTPXMock):
         """LangChain tool strips None values from arguments before calling MCP."""
-        # Mock list_tools with optional params
-        httpx_mock.add_response(
-            url="https://metadata.example.com/mcp",
-            method="POST",
-            json={
-                "jsonrpc": "2.0",
-                "id": "test",
-                "result": {
+        _queue(
+            httpx_mock,
+            rpc_result(
+                {
                     "tools": [
                         {
                             "name": "search_metadata",
@@ -130,106 +94,54 @@ class TestAsLangChainTools:
                             },
                         },
                     ]
-                },
-            },
-        )
-        # Mock tool call
-        httpx_mock.add_response(
-            url="https://metadata.example.com/mcp",
-            method="POST",
-            json={
-                "jsonrpc": "2.0",
-                "id": "test",
-                "result": {"content": [{"type": "text", "text": '{"results": []}'}]},
-            },
+                }
+            ),
         )
+        _queue(httpx_mock, rpc_result({"content": [{"type": "text", "text": '{"results": []}'}]}))
 
-        tools = client.mcp.as_langchain_tools()
+        tools = fresh_client.mcp.as_langchain_tools()
         # Invoke with optional params as None (how Pydantic defaults work)
-        tools[0].invoke({"query": "customer", "entityType": None, "queryFilter": None})
-
-        # Verify the tool call request doesn't include None values
-        requests = httpx_mock.get_requests()
-        import json
+        result = tools[0].invoke({"query": "customer", "entityType": None, "queryFilter": None})
 
-        tool_call_body = json.loads(requests[-1].content)
-        arguments = tool_call_body["params"]["arguments"]
-        assert "query" in arguments
-        assert "entityType" not in arguments
-        assert "queryFilter" not in arguments
+        assert "results" in result
+        assert sent_rpc_call(httpx_mock.get_requests()[-1]) == (
+            "tools/call",
+            {"name": "search_metadata", "arguments": {"query": "customer"}},
+        )
 
-    def test_tool_error_is_handled_not_raised(self, client, httpx_mock: HTTPXMock):
+    def test_tool_error_is_handled_not_raised(self, fresh_client, httpx_mock: HTTPXMock):
         """LangChain tool returns error string instead of raising on server error."""
-        # Mock list_tools
-        httpx_mock.add_response(
-            url="https://metadata.example.com/mcp",
-            method="POST",
-            json={
-                "jsonrpc": "2.0",
-                "id": "test",
-                "result": {
-                    "tools": [
-                        {
-                            "name": "search_metadata",
-                            "description": "Search",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "query": {"type": "string", "description": "Query"},
-                                },
-                                "required": ["query"],
-                            },
-                        },
-                    ]
-                },
-            },
-        )
-        # Mock tool call with isError
-        httpx_mock.add_response(
-            url="https://metadata.example.com/mcp",
-            method="POST",
-            json={
-                "jsonrpc": "2.0",
-                "id": "test",
-                "result": {
+        # list_tools, then a tool call that sets isError
+        _queue(
+            httpx_mock,
+            _TOOLS_LIST_BODY,
+            rpc_result(
+                {
                     "content": [{"type": "text", "text": 'argument "content" is null'}],
                     "isError": True,
-                },
-            },
+                }
+            ),
         )
 
-        tools = client.mcp.as_langchain_tools()
+        tools = fresh_client.mcp.as_langchain_tools()
         result = tools[0].invoke({"query": "customer"})
 
         assert "content" in result
         assert "null" in result
 
-    def test_filters_with_exclude(self, client, httpx_mock: HTTPXMock):
-        """as_langchain_tools filters with exclude parameter."""
-        httpx_mock.add_response(
-            url="https://metadata.example.com/mcp",
-            method="POST",
-            json={
-                "jsonrpc": "2.0",
-                "id": "test",
-                "result": {
-                    "tools": [
-                        {
-                            "name": "search_metadata",
-                            "description": "Search",
-                            "inputSchema": {"type": "object", "properties": {}},
-                        },
-                        {
-                            "name": "patch_entity",
-                            "description": "Patch",
-                            "inputSchema": {"type": "object", "properties": {}},
-                        },
-                    ]
-                },
-            },
-        )
+    @pytest.mark.parametrize(
+        ("include", "exclude", "expected"),
+        [
+            pytest.param(None, None, ["search_metadata", "patch_entity"], id="no_filters"),
+            pytest.param(None, [MCPTool.PATCH_ENTITY], ["search_metadata"], id="exclude"),
+            pytest.param([MCPTool.PATCH_ENTITY], None, ["patch_entity"], id="include"),
+        ],
+    )
+    def test_filters_tools(self, fresh_client, httpx_mock: HTTPXMock, include, exclude, expected):
+        """as_langchain_tools applies the include and exclude filters."""
+        _queue(httpx_mock, SEARCH_AND_PATCH_BODY)
 
-        tools = client.mcp.as_langchain_tools(exclude=[MCPTool.PATCH_ENTITY])
+        tools = fresh_client.mcp.as_langchain_tools(include=include, exclude=exclude)
 
-        assert len(tools) == 1
-        assert tools[0].name == "search_metadata"
+        assert all(isinstance(tool, BaseTool) for tool in tools)
+        assert [tool.name for tool in tools] == expected
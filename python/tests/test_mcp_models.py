@@ -1,5 +1,6 @@
 """Tests for MCP models."""
 
+from ai_sdk.exceptions import MCPError, MCPToolExecutionError
 from ai_sdk.mcp.models import MCPTool, ToolCallResult, ToolInfo, ToolParameter
 
 
@@ -8,17 +9,22 @@ class TestMCPToolEnum:
 
     def test_enum_has_all_tools(self):
         """MCPTool enum contains all expected tools."""
-        assert MCPTool.SEARCH_METADATA == "search_metadata"
-        assert MCPTool.SEMANTIC_SEARCH == "semantic_search"
-        assert MCPTool.GET_ENTITY_DETAILS == "get_entity_details"
-        assert MCPTool.GET_ENTITY_LINEAGE == "get_entity_lineage"
-        assert MCPTool.CREATE_GLOSSARY == "create_glossary"
-        assert MCPTool.CREATE_GLOSSARY_TERM == "create_glossary_term"
-        assert MCPTool.CREATE_LINEAGE == "create_lineage"
-        assert MCPTool.PATCH_ENTITY == "patch_entity"
-        assert MCPTool.GET_TEST_DEFINITIONS == "get_test_definitions"
-        assert MCPTool.CREATE_TEST_CASE == "create_test_case"
-        assert MCPTool.ROOT_CAUSE_ANALYSIS == "root_cause_analysis"
+        expected = {
+            "SEARCH_METADATA": "search_metadata",
+            "SEMANTIC_SEARCH": "semantic_search",
+            "GET_ENTITY_DETAILS": "get_entity_details",
+            "GET_ENTITY_LINEAGE": "get_entity_lineage",
+            "CREATE_GLOSSARY": "create_glossary",
+            "CREATE_GLOSSARY_TERM": "create_glossary_term",
+            "CREATE_LINEAGE": "create_lineage",
+            "PATCH_ENTITY": "patch_entity",
+            "GET_TEST_DEFINITIONS": "get_test_definitions",
+            "CREATE_TEST_CASE": "create_test_case",
+            "ROOT_CAUSE_ANALYSIS": "root_cause_analysis",
+        }
+        actual = {tool.name: tool.value for tool in MCPTool}
+
+        assert expected.items() <= actual.items(), expected.items() - actual.items()
 
     def test_enum_is_str_enum(self):
         """MCPTool values are strings."""
@@ -53,6 +59,13 @@ class TestToolParameter:
         )
         assert param.required is False
 
+    def test_tool_parameter_uses_slots(self):
+        """ToolParameter stays mutable but has no instance __dict__."""
+        param = ToolParameter(name="size", type="integer", description="", required=False)
+        param.required = True
+        assert param.required is True
+        assert not hasattr(param, "__dict__")
+
 
 class TestToolInfo:
     """Tests for ToolInfo dataclass."""
@@ -103,16 +116,12 @@ class TestMCPExceptions:
 
     def test_mcp_error_base(self):
         """MCPError is base exception."""
-        from ai_sdk.exceptions import MCPError
-
         error = MCPError("Something went wrong")
         assert str(error) == "Something went wrong"
         assert error.status_code is None
 
     def test_mcp_tool_execution_error(self):
         """MCPToolExecutionError includes tool name."""
-        from ai_sdk.exceptions import MCPToolExecutionError
-
         error = MCPToolExecutionError(MCPTool.SEARCH_METADATA, "Connection failed")
         assert "search_metadata" in str(error)
         assert "Connection failed" in str(error)
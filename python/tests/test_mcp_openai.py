@@ -3,57 +3,53 @@
 import pytest
 from pytest_httpx import HTTPXMock
 
-from ai_sdk.client import AISdk
-from ai_sdk.mcp.models import MCPTool
+from ai_sdk.exceptions import MCPError
+from ai_sdk.mcp._openai import build_openai_tools
+from ai_sdk.mcp.models import MCPTool, ToolInfo, ToolParameter
+from tests.mcp_helpers import (
+    JSON_HEADERS,
+    MCP_URL,
+    SEARCH_AND_PATCH_BODY,
+    rpc_result,
+    sent_rpc_call,
+)
 
-
-@pytest.fixture
-def client():
-    """AISdk client fixture."""
-    c = AISdk(
-        host="https://metadata.example.com",
-        token="test-token",
-        max_retries=0,
-    )
-    yield c
-    c.close()
+# Mocked response bodies, encoded once at import.
+_TOOLS_LIST_BODY = rpc_result(
+    {
+        "tools": [
+            {
+                "name": "search_metadata",
+                "description": "Search for metadata in the catalog",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "query": {"type": "string", "description": "Search query"},
+                        "size": {"type": "integer", "description": "Result count"},
+                    },
+                    "required": ["query"],
+                },
+            },
+        ]
+    }
+)
+_HITS_RESULT_BODY = rpc_result({"content": [{"type": "text", "text": '{"hits": 1}'}]})
 
 
 @pytest.fixture
 def mock_list_tools(httpx_mock: HTTPXMock):
     """Mock list_tools response."""
     httpx_mock.add_response(
-        url="https://metadata.example.com/mcp",
-        method="POST",
-        json={
-            "jsonrpc": "2.0",
-            "id": "test",
-            "result": {
-                "tools": [
-                    {
-                        "name": "search_metadata",
-                        "description": "Search for metadata in the catalog",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "query": {"type": "string", "description": "Search query"},
-                                "size": {"type": "integer", "description": "Result count"},
-                            },
-                            "required": ["query"],
-                        },
-                    },
-                ]
-            },
-        },
+        url=MCP_URL, method="POST", content=_TOOLS_LIST_BODY, headers=JSON_HEADERS
     )
 
 
 class TestAsOpenAITools:
     """Tests for MCPClient.as_openai_tools()."""
 
-    def test_returns_openai_function_schema(self, client, mock_list_tools):
+    def test_returns_openai_function_schema(self, fresh_client, mock_list_tools):
         """as_openai_tools returns OpenAI function calling format."""
-        tools = client.mcp.as_openai_tools()
+        tools = fresh_client.mcp.as_openai_tools()
 
         assert len(tools) == 1
         tool = tools[0]
@@ -65,32 +61,57 @@ class TestAsOpenAITools:
         assert "query" in tool["function"]["parameters"]["properties"]
         assert "query" in tool["function"]["parameters"]["required"]
 
-    def test_filters_tools_with_include(self, client, httpx_mock: HTTPXMock):
+    def test_filters_tools_with_include(self, fresh_client, httpx_mock: HTTPXMock):
         """as_openai_tools filters with include parameter."""
         httpx_mock.add_response(
-            url="https://metadata.example.com/mcp",
-            method="POST",
-            json={
-                "jsonrpc": "2.0",
-                "id": "test",
-                "result": {
-                    "tools": [
-                        {
-                            "name": "search_metadata",
-                            "description": "Search",
-                            "inputSchema": {"type": "object", "properties": {}},
-                        },
-                        {
-                            "name": "patch_entity",
-                            "description": "Patch",
-                            "inputSchema": {"type": "object", "properties": {}},
-                        },
-                    ]
-                },
-            },
+            url=MCP_URL, method="POST", content=SEARCH_AND_PATCH_BODY, headers=JSON_HEADERS
         )
 
-        tools = client.mcp.as_openai_tools(include=[MCPTool.SEARCH_METADATA])
+        tools = fresh_client.mcp.as_openai_tools(include=[MCPTool.SEARCH_METADATA])
 
         assert len(tools) == 1
         assert tools[0]["function"]["name"] == "search_metadata"
+
+    def test_mutating_schema_does_not_affect_later_calls(self):
+        """Each call returns fresh schemas that callers may modify."""
+        params = [ToolParameter(name="query", type="string", description="Q", required=True)]
+        tools = [ToolInfo(MCPTool.SEARCH_METADATA, "Search", params)]
+        first = build_openai_tools(tools)
+        first[0]["strict"] = True
+        first[0]["function"]["parameters"]["required"].append("limit")
+        first[0]["function"]["parameters"]["properties"]["query"]["type"] = "integer"
+
+        second = build_openai_tools(tools)
+
+        assert "strict" not in second[0]
+        assert second[0]["function"]["parameters"]["required"] == ["query"]
+        assert second[0]["function"]["parameters"]["properties"]["query"]["type"] == "string"
+
+
+class TestCreateToolExecutor:
+    """Tests for MCPClient.create_tool_executor()."""
+
+    def test_unknown_tool_raises_mcp_error(self, fresh_client):
+        """Executor rejects tool names not in MCPTool."""
+        execute = fresh_client.mcp.create_tool_executor()
+
+        with pytest.raises(MCPError, match="Unknown MCP tool: some_future_tool"):
+            execute("some_future_tool", {})
+
+    def test_drops_none_arguments(self, fresh_client, httpx_mock: HTTPXMock):
+        """Executor strips None-valued arguments before calling the tool."""
+        httpx_mock.add_response(
+            url=MCP_URL,
+            method="POST",
+            content=_HITS_RESULT_BODY,
+            headers=JSON_HEADERS,
+        )
+        execute = fresh_client.mcp.create_tool_executor()
+
+        result = execute("search_metadata", {"query": "customers", "size": None})
+
+        assert result == {"hits": 1}
+        assert sent_rpc_call(httpx_mock.get_request()) == (
+            "tools/call",
+            {"name": "search_metadata", "arguments": {"query": "customers"}},
+        )
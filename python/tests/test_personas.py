@@ -3,63 +3,43 @@
 import pytest
 from pytest_httpx import HTTPXMock
 
-from ai_sdk.client import AISdk
 from ai_sdk.exceptions import PersonaNotFoundError
 from ai_sdk.models import CreatePersonaRequest, PersonaInfo
 
-
-@pytest.fixture
-def client():
-    """AISdk client fixture."""
-    c = AISdk(
-        host="https://metadata.example.com",
-        token="test-jwt-token",
-    )
-    yield c
-    c.close()
-
-
-@pytest.fixture
-def async_client():
-    """AISdk client fixture with async enabled."""
-    c = AISdk(
-        host="https://metadata.example.com",
-        token="test-jwt-token",
-        enable_async=True,
-    )
-    yield c
-    c.close()
-
-
-@pytest.fixture
+_SAMPLE_PERSONA_INFO = {
+    "id": "550e8400-e29b-41d4-a716-446655440001",
+    "name": "DataAnalyst",
+    "displayName": "Data Analyst",
+    "description": "An AI persona specialized in data analysis",
+    "prompt": "You are a data analyst who helps users understand their data.",
+    "provider": "user",
+}
+
+_SAMPLE_PERSONAS_LIST = {
+    "data": [
+        _SAMPLE_PERSONA_INFO,
+        {
+            "id": "550e8400-e29b-41d4-a716-446655440002",
+            "name": "DataEngineer",
+            "displayName": "Data Engineer",
+            "description": "An AI persona specialized in data engineering",
+            "prompt": "You are a data engineer who helps with data pipelines.",
+            "provider": "system",
+        },
+    ]
+}
+
+
+@pytest.fixture(scope="module")
 def sample_persona_info_dict():
     """Sample persona info as returned by API."""
-    return {
-        "id": "550e8400-e29b-41d4-a716-446655440001",
-        "name": "DataAnalyst",
-        "displayName": "Data Analyst",
-        "description": "An AI persona specialized in data analysis",
-        "prompt": "You are a data analyst who helps users understand their data.",
-        "provider": "user",
-    }
-
-
-@pytest.fixture
-def sample_personas_list_response(sample_persona_info_dict):
+    return _SAMPLE_PERSONA_INFO
+
+
+@pytest.fixture(scope="module")
+def sample_personas_list_response():
     """Sample list personas response as returned by API."""
-    return {
-        "data": [
-            sample_persona_info_dict,
-            {
-                "id": "550e8400-e29b-41d4-a716-446655440002",
-                "name": "DataEngineer",
-                "displayName": "Data Engineer",
-                "description": "An AI persona specialized in data engineering",
-                "prompt": "You are a data engineer who helps with data pipelines.",
-                "provider": "system",
-            },
-        ]
-    }
+    return _SAMPLE_PERSONAS_LIST
 
 
 class TestListPersonas:
@@ -262,34 +242,19 @@ class TestCreatePersona:
 class TestAsyncClientRequirement:
     """Tests for async client requirement."""
 
-    def test_alist_personas_without_async_raises_error(self, client):
-        """alist_personas raises RuntimeError without async enabled."""
-        with pytest.raises(RuntimeError) as exc_info:
-            import asyncio
-
-            asyncio.get_event_loop().run_until_complete(client.alist_personas())
-
-        assert "enable_async=True" in str(exc_info.value)
-
-    def test_aget_persona_without_async_raises_error(self, client):
-        """aget_persona raises RuntimeError without async enabled."""
-        with pytest.raises(RuntimeError) as exc_info:
-            import asyncio
-
-            asyncio.get_event_loop().run_until_complete(client.aget_persona("test"))
-
-        assert "enable_async=True" in str(exc_info.value)
-
-    def test_acreate_persona_without_async_raises_error(self, client):
-        """acreate_persona raises RuntimeError without async enabled."""
-        with pytest.raises(RuntimeError) as exc_info:
-            import asyncio
-
-            request = CreatePersonaRequest(
-                name="Test",
-                description="Test",
-                prompt="Test",
-            )
-            asyncio.get_event_loop().run_until_complete(client.acreate_persona(request))
-
-        assert "enable_async=True" in str(exc_info.value)
+    @pytest.mark.parametrize(
+        "call",
+        [
+            lambda c: c.alist_personas(),
+            lambda c: c.aget_persona("test"),
+            lambda c: c.acreate_persona(
+                CreatePersonaRequest(name="Test", description="Test", prompt="Test")
+            ),
+        ],
+        ids=["list", "get", "create"],
+    )
+    @pytest.mark.asyncio
+    async def test_async_method_without_async_raises_error(self, client, call):
+        """Async persona methods raise RuntimeError without async enabled."""
+        with pytest.raises(RuntimeError, match="enable_async=True"):
+            await call(client)
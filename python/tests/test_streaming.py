@@ -42,6 +42,15 @@ class TestSSEIterator:
         assert len(events) == 1
         assert events[0].content == "Chunked"
 
+    def test_handles_multibyte_character_split_across_chunks(self):
+        """SSEIterator decodes UTF-8 characters split across chunks."""
+        raw = 'event: message\ndata: {"content": "caf\u00e9"}\n\n'.encode()
+        split = raw.index(b"\xc3") + 1
+        events = list(SSEIterator(iter([raw[:split], raw[split:]])))
+
+        assert len(events) == 1
+        assert events[0].content == "caf\u00e9"
+
     def test_handles_multiple_events_in_single_chunk(self):
         """SSEIterator handles multiple events in one chunk."""
         stream = iter(
@@ -87,6 +96,14 @@ class TestSSEIterator:
         assert len(events) == 1
         assert events[0].content == "Plain text message"
 
+    def test_joins_multiline_data(self):
+        """SSEIterator joins multiple data lines into one payload."""
+        stream = iter([b'event: message\ndata: {"content":\ndata: "Split JSON"}\n\n'])
+        events = list(SSEIterator(stream))
+
+        assert len(events) == 1
+        assert events[0].content == "Split JSON"
+
     def test_skips_empty_data(self):
         """SSEIterator skips events with no data field."""
         stream = iter(
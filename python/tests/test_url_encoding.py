@@ -2,50 +2,25 @@
 
 from unittest.mock import MagicMock
 
-from ai_sdk.client import AISdk
-
-
-def test_get_bot_encodes_name_with_slash():
-    """Test that bot names with slashes are URL-encoded."""
-    client = AISdk(host="https://test.com", token="test-token")
-    client._bots_http = MagicMock()
-    client._bots_http.get.return_value = {"id": "123", "name": "test/bot"}
-
-    client.get_bot("test/bot")
-
-    client._bots_http.get.assert_called_once()
-    call_args = client._bots_http.get.call_args
-    # The path should contain %2F (encoded slash)
-    assert "test%2Fbot" in call_args[0][0]
-
-
-def test_get_bot_encodes_name_with_spaces():
-    """Test that bot names with spaces are URL-encoded."""
-    client = AISdk(host="https://test.com", token="test-token")
-    client._bots_http = MagicMock()
-    client._bots_http.get.return_value = {"id": "123", "name": "my bot"}
-
-    client.get_bot("my bot")
-
-    client._bots_http.get.assert_called_once()
-    call_args = client._bots_http.get.call_args
-    # The path should contain %20 (encoded space)
-    assert "my%20bot" in call_args[0][0]
-
-
-def test_get_persona_encodes_name_with_special_chars():
-    """Test that persona names with special chars are URL-encoded."""
-    client = AISdk(host="https://test.com", token="test-token")
-    client._personas_http = MagicMock()
-    client._personas_http.get.return_value = {
-        "id": "123",
-        "name": "test&persona",
-        "provider": "user",
-    }
-
-    client.get_persona("test&persona")
-
-    client._personas_http.get.assert_called_once()
-    call_args = client._personas_http.get.call_args
-    # The path should contain %26 (encoded ampersand)
-    assert "test%26persona" in call_args[0][0]
+import pytest
+
+
+@pytest.mark.parametrize(
+    ("attr", "method", "name", "encoded"),
+    [
+        ("_bots_http", "get_bot", "test/bot", "test%2Fbot"),
+        ("_bots_http", "get_bot", "my bot", "my%20bot"),
+        ("_personas_http", "get_persona", "test&persona", "test%26persona"),
+    ],
+    ids=["bot-slash", "bot-space", "persona-ampersand"],
+)
+def test_get_encodes_name(client, monkeypatch, attr, method, name, encoded):
+    """Test that names with special chars are URL-encoded in the request path."""
+    http = MagicMock()
+    http.get.return_value = {"id": "123", "name": name, "provider": "user"}
+    monkeypatch.setattr(client, attr, http)
+
+    getattr(client, method)(name)
+
+    http.get.assert_called_once()
+    assert encoded in http.get.call_args[0][0]